@@ -6,7 +6,12 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath('src'))
 from rtldavis.protocol import Parser
-p = Parser(14)
-hop_idx = p.hop_pattern.index(0)
-hop = p.set_hop(hop_idx, p.transmitter)
-print(hop.channel_freq)
+
+def main():
+    p = Parser(14)
+    hop_idx = p.hop_pattern.index(0)
+    hop = p.set_hop(hop_idx, p.transmitter)
+    print(hop.channel_freq)
+
+if __name__ == "__main__":
+    main()
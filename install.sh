@@ -79,6 +79,22 @@ fi
 echo "Copying project files..."
 rsync -av --exclude='.venv' --exclude='.git' --exclude='__pycache__' . "$INSTALL_DIR"
 
+# .git is not copied, so record the commit now instead of shelling out to git
+# on every service start (see get_git_info in __main__.py).
+if [ -d ".git" ]; then
+    GIT_COMMIT=$(git rev-parse --short HEAD 2>/dev/null || true)
+    if [ -n "$GIT_COMMIT" ]; then
+        GIT_DIRTY=False
+        if [ -n "$(git status --porcelain 2>/dev/null)" ]; then
+            GIT_DIRTY=True
+        fi
+        cat <<EOF > "$INSTALL_DIR/src/rtldavis/_build_info.py"
+GIT_COMMIT = "$GIT_COMMIT"
+GIT_DIRTY = $GIT_DIRTY
+EOF
+    fi
+fi
+
 # Set permissions
 chown -R root:root "$INSTALL_DIR"
 
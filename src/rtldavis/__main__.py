@@ -1,22 +1,19 @@
 import logging
 import sys
 import asyncio
-import argparse
-from typing import List, Optional
+import functools
+from typing import TYPE_CHECKING, List, Optional, Tuple
 import subprocess
 import time
 from dataclasses import dataclass
 
-try:
-    from rtlsdr.rtlsdr import RtlSdr, librtlsdr
-    from rtlsdr.rtlsdraio import RtlSdrAio
-    HAS_RTLSDR = True
-except ImportError:
-    HAS_RTLSDR = False
-
 from .version import __version__
-from .sensor_store import SensorStore
-from .mqtt import MQTTPublisher
+
+# argparse, pyrtlsdr (which pulls in numpy and loads librtlsdr) and the
+# MQTT/decoder stack are imported where they are first needed, so
+# `--version` and `--list-rtlsdr-devices` start without paying for them.
+if TYPE_CHECKING:
+    from .mqtt import MQTTPublisher
 
 @dataclass
 class GitInfo:
@@ -29,7 +26,20 @@ class SDRDevice:
     name: str
     serial: str
 
+# Written by install.sh: the installed copy has no .git directory to query.
+try:
+    from ._build_info import GIT_COMMIT, GIT_DIRTY
+except ImportError:
+    GIT_COMMIT, GIT_DIRTY = None, False
+
+# Seconds an RTL-SDR enumeration result is reused before the USB bus is re-scanned.
+DEVICE_CACHE_SECONDS = 5
+
+
+@functools.lru_cache(maxsize=None)
 def get_git_info() -> Optional[GitInfo]:
+    if GIT_COMMIT:
+        return GitInfo(GIT_COMMIT, GIT_DIRTY)
     try:
         commit_hash = (
             subprocess.check_output(["git", "rev-parse", "--short", "HEAD"])
@@ -46,20 +56,90 @@ def get_git_info() -> Optional[GitInfo]:
     except (subprocess.CalledProcessError, FileNotFoundError):
         return None
 
-def list_sdr_devices() -> List[SDRDevice]:
-    """List available RTL-SDR devices."""
-    if not HAS_RTLSDR:
-        raise RuntimeError("RTL-SDR python module or C library (librtlsdr) is not installed on this system.")
-        
-    devices: List[SDRDevice] = []
+@functools.lru_cache(maxsize=None)
+def has_rtlsdr() -> bool:
+    """Whether pyrtlsdr and librtlsdr are importable. Imports them on first call."""
+    try:
+        import rtlsdr.rtlsdr  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _enumerate_sdr_devices(_time_bucket: int) -> Tuple[SDRDevice, ...]:
+    # Reading serials opens every dongle on the bus; the bucket argument keys the
+    # cache so repeated calls within DEVICE_CACHE_SECONDS reuse the last scan.
+    from rtlsdr.rtlsdr import RtlSdr
+
     try:
         serials = RtlSdr.get_device_serial_addresses()
-        for i, serial in enumerate(serials):
-            devices.append(SDRDevice(index=i, name="RTL-SDR", serial=serial))
-        return devices
+        return tuple(
+            SDRDevice(index=i, name="RTL-SDR", serial=serial)
+            for i, serial in enumerate(serials)
+        )
     except Exception as e:
         raise RuntimeError(f"Failed to enumerate RTL-SDR devices: {e}") from e
 
+
+def list_sdr_devices() -> List[SDRDevice]:
+    """List available RTL-SDR devices."""
+    if not has_rtlsdr():
+        raise RuntimeError("RTL-SDR python module or C library (librtlsdr) is not installed on this system.")
+
+    return list(_enumerate_sdr_devices(int(time.monotonic() // DEVICE_CACHE_SECONDS)))
+
+
+def _rtlsdr_device_count() -> int:
+    # Counts the dongles from their USB descriptors without opening any of them
+    from rtlsdr.librtlsdr import librtlsdr
+
+    return librtlsdr.rtlsdr_get_device_count()
+
+
+def _rtlsdr_device_serial(index: int) -> str:
+    from ctypes import c_ubyte
+
+    from rtlsdr.librtlsdr import librtlsdr
+
+    buf = (c_ubyte * 256)()
+    if librtlsdr.rtlsdr_get_device_usb_strings(index, None, None, buf) != 0:
+        raise RuntimeError(f"Failed to read the serial of RTL-SDR device {index}")
+    return bytes(buf).split(b"\0", 1)[0].decode("ascii", errors="replace")
+
+
+def _rtlsdr_index_by_serial(serial: str) -> int:
+    # Index of the dongle with this serial, or negative if there is none
+    from rtlsdr.librtlsdr import librtlsdr
+
+    return librtlsdr.rtlsdr_get_index_by_serial(serial.encode("ascii"))
+
+
+def device_from_index(value: Optional[str]) -> Optional[SDRDevice]:
+    """
+    Build an SDRDevice straight from a plain decimal index, reading only that
+    dongle's serial instead of enumerating the whole bus.
+
+    Serials still take priority, as in the full lookup: values with leading
+    zeros (e.g. "00000001"), not below the device count (e.g. "1001"), or equal
+    to the serial of a dongle at another index are left to the serial lookup.
+    """
+    if not value or not value.isdigit() or str(int(value)) != value:
+        return None
+    index = int(value)
+    try:
+        if index >= _rtlsdr_device_count():
+            return None
+        serial_index = _rtlsdr_index_by_serial(value)
+        if serial_index >= 0 and serial_index != index:
+            return None
+        serial = _rtlsdr_device_serial(index)
+    except Exception:
+        # Let the full enumeration report the problem
+        return None
+    return SDRDevice(index=index, name="RTL-SDR", serial=serial)
+
+
 def setup_logging(verbosity: int) -> int:
     """Configure logging."""
     if verbosity == 1:
@@ -75,8 +155,20 @@ def setup_logging(verbosity: int) -> int:
     return level
 
 
+def version_string() -> str:
+    git_info = get_git_info()
+    version_str = f"rtldavis {__version__}"
+    if git_info:
+        version_str += (
+            f" (git: {git_info.commit_hash}{' dirty' if git_info.is_dirty else ''})"
+        )
+    return version_str
+
+
 async def main_async() -> int:
     """Asynchronous main function."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Davis Instruments weather station receiver"
     )
@@ -169,6 +261,23 @@ async def main_async() -> int:
     parser.add_argument("--buttons", action="store_true", help="Enable local GPIO 5-way button handling")
     parser.add_argument("--ws-port", type=int, default=8089, help="WebSocket server port (default: 8089)")
     parser.add_argument("--timeout", type=int, default=0, help="Stop after N seconds (0 = run forever)")
+    parser.add_argument(
+        "--cpu",
+        type=int,
+        default=None,
+        help="Pin the main process (hop timing, SDR reads) to this CPU core; the DSP worker uses the others (Linux only)",
+    )
+    parser.add_argument(
+        "--dsp-thread",
+        action="store_true",
+        help="Demodulate on a thread of the main process instead of a separate worker process (best with the 'jit' extra)",
+    )
+    parser.add_argument(
+        "--rt-priority",
+        type=int,
+        default=0,
+        help="Run the main process with SCHED_FIFO at this priority, 1-99 (Linux only, needs CAP_SYS_NICE; default: off)",
+    )
 
     args = parser.parse_args()
 
@@ -176,13 +285,7 @@ async def main_async() -> int:
     logger = logging.getLogger("rtldavis")
 
     if args.version:
-        git_info = get_git_info()
-        version_str = f"rtldavis {__version__}"
-        if git_info:
-            version_str += (
-                f" (git: {git_info.commit_hash}{' dirty' if git_info.is_dirty else ''})"
-            )
-        print(version_str)
+        print(version_string())
         return 0
 
     logger.warning(f"Starting rtldavis {__version__}")
@@ -192,18 +295,30 @@ async def main_async() -> int:
             f"Git commit: {git_info.commit_hash}{' (dirty)' if git_info.is_dirty else ''}"
         )
 
+    if args.cpu is not None or args.rt_priority > 0:
+        from . import scheduling
+
+        if args.cpu is not None:
+            scheduling.pin_to_cpus({args.cpu})
+        if args.rt_priority > 0:
+            scheduling.set_realtime_priority(args.rt_priority)
+
     if args.timeout > 0:
         async def stop_after_timeout():
-            import asyncio, os, signal
+            import os, signal
             await asyncio.sleep(args.timeout)
             logger.warning(f"Timeout of {args.timeout}s reached, stopping rtldavis.")
             os.kill(os.getpid(), signal.SIGINT)
         asyncio.create_task(stop_after_timeout())
 
+    from .sensor_store import SensorStore
+
     sensor_store = SensorStore()
 
-    mqtt_publisher: Optional[MQTTPublisher] = None
+    mqtt_publisher: Optional["MQTTPublisher"] = None
     if args.mqtt_broker:
+        from .mqtt import MQTTPublisher
+
         mqtt_publisher = MQTTPublisher(
             broker=args.mqtt_broker,
             port=args.mqtt_port,
@@ -221,10 +336,18 @@ async def main_async() -> int:
         return await run(args, log_level, sensor_store, mqtt_publisher)
     
     # Dual and RTLSDR modes require librtlsdr
-    if not HAS_RTLSDR:
+    if not has_rtlsdr():
         logger.error("Cannot use 'rtlsdr' or 'dual' radio backend: librtlsdr is not installed. Did you mean '--radio cc1101'?")
         return 1
 
+    selected_device: Optional[SDRDevice] = None
+    if not args.list_rtlsdr_devices:
+        selected_device = device_from_index(args.rtlsdr_device)
+
+    if selected_device:
+        devices = [selected_device]
+        return await _run_sdr(args, log_level, devices, selected_device, sensor_store, mqtt_publisher)
+
     try:
         devices = list_sdr_devices()
     except RuntimeError as e:
@@ -244,7 +367,6 @@ async def main_async() -> int:
         logger.error("No RTL-SDR devices found. Please connect a device.")
         return 1
 
-    selected_device: Optional[SDRDevice] = None
     if args.rtlsdr_device:
         selected_device = next((d for d in devices if d.serial == args.rtlsdr_device), None)
         if not selected_device:
@@ -263,6 +385,10 @@ async def main_async() -> int:
             logger.error("Multiple RTL-SDR devices found. Please specify one.")
         return 1
 
+    return await _run_sdr(args, log_level, devices, selected_device, sensor_store, mqtt_publisher)
+
+
+async def _run_sdr(args, log_level, devices, selected_device, sensor_store, mqtt_publisher) -> int:
     if args.radio == "dual":
         from .runners.dual import run
         return await run(args, log_level, devices, selected_device, sensor_store, mqtt_publisher)
@@ -272,6 +398,10 @@ async def main_async() -> int:
 
 
 def main() -> int:
+    # Answer --version before argparse, asyncio.run() or any radio imports
+    if "--version" in sys.argv[1:]:
+        print(version_string())
+        return 0
     try:
         import multiprocessing
         multiprocessing.set_start_method("fork")
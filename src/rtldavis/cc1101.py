@@ -348,7 +348,8 @@ class CC1101:
         data_bytes = _DAVIS_PREAMBLE + payload
         data = __import__("numpy").frombuffer(data_bytes, dtype=__import__("numpy").uint8)
 
-        logger.debug(f"CC1101 packet: {payload.hex()} RSSI={rssi:.1f} dBm LQI={lqi_raw & 0x7F}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"CC1101 packet: {payload.hex()} RSSI={rssi:.1f} dBm LQI={lqi_raw & 0x7F}")
 
         return dsp.Packet(index=-1, data=data, rssi=rssi, snr=snr)
 
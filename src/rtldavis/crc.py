@@ -1,5 +1,12 @@
+import binascii
+from typing import Dict, List, Tuple
+
 import numpy as np
 
+# poly -> (table, slice-by-8 tables). Tables depend only on the polynomial, so
+# every CRC instance with the same poly shares one read-only copy.
+_TABLE_CACHE: Dict[int, Tuple[np.ndarray, List[List[int]]]] = {}
+
 
 class CRC:
     """
@@ -11,32 +18,81 @@ class CRC:
         self.init: np.uint16 = np.uint16(init)
         self.poly: np.uint16 = np.uint16(poly)
         self.residue: np.uint16 = np.uint16(residue)
-        self.tbl: np.ndarray = self._new_table(self.poly)
+        self.tbl: np.ndarray
+        # Plain-int tables for checksum(): indexing an ndarray and shifting
+        # np.uint16 scalars boxes a NumPy object per operation.
+        self._slice_tbls: List[List[int]]
+        self.tbl, self._slice_tbls = self._tables(self.poly)
+        # binascii.crc_hqx is CPython's C implementation of exactly this CRC
+        # (poly 0x1021, MSB-first, no final XOR), with any initial value.
+        self._hqx: bool = int(self.poly) == 0x1021
 
     def __str__(self) -> str:
         return f"{{Name:{self.name} Init:0x{self.init:04X} Poly:0x{self.poly:04X} Residue:0x{self.residue:04X}}}"
 
-    def checksum(self, data: bytes) -> np.uint16:
+    def checksum(self, data: bytes) -> int:
         """
         Calculates the CRC-16-CCITT checksum for the given data.
         """
-        crc: np.uint16 = self.init
-        for byte in data:
-            crc = ((crc << 8) & 0xFFFF) ^ self.tbl[(crc >> 8) ^ byte]
+        if self._hqx:
+            return binascii.crc_hqx(data, int(self.init))
+
+        t0, t1, t2, t3, t4, t5, t6, t7 = self._slice_tbls
+        crc = int(self.init)
+
+        # Slice-by-8: one table lookup per byte, but eight bytes per loop
+        # iteration. A Davis payload plus CRC is exactly one iteration.
+        n8 = len(data) & ~7
+        for i in range(0, n8, 8):
+            b0, b1, b2, b3, b4, b5, b6, b7 = data[i : i + 8]
+            crc = (
+                t7[(crc >> 8) ^ b0] ^ t6[(crc & 0xFF) ^ b1] ^ t5[b2] ^ t4[b3]
+                ^ t3[b4] ^ t2[b5] ^ t1[b6] ^ t0[b7]
+            )
+
+        for byte in data[n8:]:
+            crc = ((crc << 8) & 0xFFFF) ^ t0[(crc >> 8) ^ byte]
         return crc
 
+    @classmethod
+    def _tables(cls, poly: np.uint16) -> Tuple[np.ndarray, List[List[int]]]:
+        tables = _TABLE_CACHE.get(int(poly))
+        if tables is None:
+            tbl = cls._new_table(poly)
+            tbl.flags.writeable = False
+            tables = _TABLE_CACHE[int(poly)] = (tbl, cls._new_slice_tables(tbl.tolist()))
+        return tables
+
+    @staticmethod
+    def _new_slice_tables(tbl: List[int]) -> List[List[int]]:
+        """
+        Creates the slice-by-8 tables: tables[k][b] is the CRC contribution of
+        byte b followed by k zero bytes; tables[0] is the regular table.
+        """
+        tables = [tbl]
+        for _ in range(7):
+            prev = tables[-1]
+            tables.append([((c << 8) & 0xFFFF) ^ tbl[c >> 8] for c in prev])
+        return tables
+
     @staticmethod
     def _new_table(poly: np.uint16) -> np.ndarray:
         """
         Creates a new CRC table.
         """
-        table = np.zeros(256, dtype=np.uint16)
+        # Built with Python ints and converted once; shifting np.uint16 scalars
+        # costs a NumPy object per bit, and this runs at import.
+        poly = int(poly)
+        table = []
         for i in range(256):
-            crc = np.uint16(i) << 8
+            crc = i << 8
             for _ in range(8):
                 if crc & 0x8000:
-                    crc = (crc << 1) ^ poly
+                    crc = ((crc << 1) ^ poly) & 0xFFFF
                 else:
-                    crc <<= 1
-            table[i] = crc
-        return table
+                    crc = (crc << 1) & 0xFFFF
+            table.append(crc)
+        return np.array(table, dtype=np.uint16)
+
+# Build the Davis (CCITT) tables at import rather than on the first packet
+CRC._tables(np.uint16(0x1021))
@@ -1,5 +1,12 @@
 import argparse
 
+import numpy as np
+
+# Candidate encodings tried by decode_brute_force()
+_MASK_BITS = np.array([10, 12, 15, 16], dtype=np.uint32)
+_SCALES = np.array([1.0, 10.0, 100.0])
+_OFFSETS = np.array([0.0, -40.0, -90.0])
+
 
 def decode_brute_force(hex_data, target_value):
     """
@@ -10,56 +17,55 @@ def decode_brute_force(hex_data, target_value):
 
     found = False
 
-    # Try different byte positions
-    for i in range(len(data) - 1):
-        # 16-bit value from bytes i and i+1
-        val_16bit = (data[i] << 8) | data[i + 1]
-
-        # Try different masks (10-bit, 12-bit, 15-bit, 16-bit)
-        for mask_bits in [10, 12, 15, 16]:
-            mask = (1 << mask_bits) - 1
-            masked_val = val_16bit & mask
-
-            # Try different scaling factors
-            for scale in [1.0, 10.0, 100.0]:
-                scaled_val = masked_val / scale
-
-                # Check direct match
-                if abs(scaled_val - target_value) < 0.1:
-                    print("SUCCESS: Found match!")
-                    print(
-                        f"  - Bytes: data[{i}] and data[{i + 1}] ({data[i]:02x} {data[i + 1]:02x})"
-                    )
-                    print(f"  - Logic: ((data[{i}] << 8) | data[{i + 1}]) & 0x{mask:X}")
-                    print(f"  - Raw value: {masked_val}")
-                    print(f"  - Scale: / {scale}")
-                    print(f"  - Result: {scaled_val:.1f}\n")
-                    found = True
+    # Every (byte pair, mask, scale, offset) candidate in one broadcast instead of
+    # four nested loops. np.argwhere walks the result in C order, so matches are
+    # reported in the same order the loops would have found them.
+    arr = np.frombuffer(data, dtype=np.uint8).astype(np.uint32)
+    vals16 = (arr[:-1] << 8) | arr[1:]
+    masks = (1 << _MASK_BITS) - 1
+    masked = vals16[:, None] & masks[None, :]
+    scaled = masked[:, :, None] / _SCALES[None, None, :]
+    # Offset 0 is the direct match
+    candidates = scaled[..., None] + _OFFSETS
+    hits = np.argwhere(np.abs(candidates - target_value) < 0.1)
+    # Hex of every byte, formatted once for all the printed matches
+    hex_bytes = data.hex(" ").split()
 
-                # Check with offset
-                for offset in [-40.0, -90.0]:
-                    offset_val = scaled_val + offset
-                    if abs(offset_val - target_value) < 0.1:
-                        print("SUCCESS: Found match with offset!")
-                        print(
-                            f"  - Bytes: data[{i}] and data[{i + 1}] ({data[i]:02x} {data[i + 1]:02x})"
-                        )
-                        print(
-                            f"  - Logic: (((data[{i}] << 8) | data[{i + 1}]) & 0x{mask:X}) / {scale}) + {offset}"
-                        )
-                        print(f"  - Raw value: {masked_val}")
-                        print(f"  - Result: {offset_val:.1f}\n")
-                        found = True
+    for i, m, s, o in hits:
+        mask = int(masks[m])
+        masked_val = int(masked[i, m])
+        scale = float(_SCALES[s])
+        if o == 0:
+            scaled_val = float(scaled[i, m, s])
+            print("SUCCESS: Found match!")
+            print(
+                f"  - Bytes: data[{i}] and data[{i + 1}] ({hex_bytes[i]} {hex_bytes[i + 1]})"
+            )
+            print(f"  - Logic: ((data[{i}] << 8) | data[{i + 1}]) & 0x{mask:X}")
+            print(f"  - Raw value: {masked_val}")
+            print(f"  - Scale: / {scale}")
+            print(f"  - Result: {scaled_val:.1f}\n")
+        else:
+            offset = float(_OFFSETS[o])
+            offset_val = float(candidates[i, m, s, o])
+            print("SUCCESS: Found match with offset!")
+            print(
+                f"  - Bytes: data[{i}] and data[{i + 1}] ({hex_bytes[i]} {hex_bytes[i + 1]})"
+            )
+            print(
+                f"  - Logic: (((data[{i}] << 8) | data[{i + 1}]) & 0x{mask:X}) / {scale}) + {offset}"
+            )
+            print(f"  - Raw value: {masked_val}")
+            print(f"  - Result: {offset_val:.1f}\n")
+        found = True
 
     # Try single bytes
-    for i in range(len(data)):
-        val_8bit = data[i]
-        if abs(val_8bit - target_value) < 0.1:
-            print("SUCCESS: Found match (8-bit)!")
-            print(f"  - Byte: data[{i}] ({data[i]:02x})")
-            print(f"  - Logic: data[{i}]")
-            print(f"  - Result: {val_8bit}\n")
-            found = True
+    for i in np.flatnonzero(np.abs(arr - float(target_value)) < 0.1):
+        print("SUCCESS: Found match (8-bit)!")
+        print(f"  - Byte: data[{i}] ({hex_bytes[i]})")
+        print(f"  - Logic: data[{i}]")
+        print(f"  - Result: {data[i]}\n")
+        found = True
 
     if not found:
         print("No simple decoding pattern found.")
@@ -13,3 +13,20 @@ from .common import (
     RSSISensor,
     SNRSensor,
 )
+
+# The sensor classes MQTT discovery and the SensorStore register
+__all__ = [
+    "TemperatureSensor",
+    "HumiditySensor",
+    "RainTotalSensor",
+    "RainRateSensor",
+    "SupercapSensor",
+    "UVSensor",
+    "SolarSensor",
+    "LightSensor",
+    "WindSpeedSensor",
+    "WindDirectionSensor",
+    "WindGustSensor",
+    "RSSISensor",
+    "SNRSensor",
+]
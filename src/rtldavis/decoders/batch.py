@@ -0,0 +1,115 @@
+"""
+Vectorized decoders for replaying logged packet streams.
+
+Each function takes an (N, 8) uint8 array of message bytes (the payload after
+the sync word, as passed to the per-packet decoders) and returns N values, equal
+to what the matching sensor's decode() returns for each row. Live decoding keeps
+using the per-packet classes, which also log their breakdown and, for rain
+totals, keep state across packets.
+"""
+import numpy as np
+
+from .common import _WIND_DEG_LUT
+from .rain_rate import _CLICK_TIME_DIVISORS as _CLICK_TIME_DIVISOR_LUT
+from .solar import _INV_2_27
+
+# round(mph * 1.60934, 1) for every possible byte; Python's round() is correctly
+# rounded, which np.round's scale-and-round is not.
+_MPH_TO_KMH = np.array([round(mph * 1.60934, 1) for mph in range(256)])
+_WIND_DEG = np.array(_WIND_DEG_LUT)
+# 36.0 / (raw / d) == 36.0 * d / raw exactly: dividing by 1.0 or 16.0 is exact
+_RATE_NUMERATORS = 36.0 * np.array(_CLICK_TIME_DIVISOR_LUT)
+
+
+def as_packet_array(packets) -> np.ndarray:
+    """Stacks an iterable of 8-byte messages (bytes or arrays) into an (N, 8) uint8 array."""
+    # One join and one buffer wrap instead of an ndarray per packet
+    rows = [bytes(p) for p in packets]
+    if any(len(row) != 8 for row in rows):
+        raise ValueError("every packet must be exactly 8 bytes")
+    return np.frombuffer(bytearray().join(rows), dtype=np.uint8).reshape(-1, 8)
+
+
+def decode_wind_speed(arr: np.ndarray) -> np.ndarray:
+    """WindSpeedSensor.decode for each row, in km/h."""
+    return _MPH_TO_KMH[arr[:, 1]]
+
+
+def decode_wind_gust(arr: np.ndarray) -> np.ndarray:
+    """WindGustSensor.decode for each row, in km/h."""
+    return _MPH_TO_KMH[arr[:, 3]]
+
+
+def decode_wind_direction(arr: np.ndarray) -> np.ndarray:
+    """WindDirectionSensor.decode for each row, in degrees."""
+    raw = (arr[:, 2].astype(np.int32) << 1) | ((arr[:, 4] & 2) >> 1)
+    return _WIND_DEG[raw]
+
+
+def decode_temperature(arr: np.ndarray) -> np.ndarray:
+    """TemperatureSensor.decode for each row, in °F."""
+    raw = (arr[:, 3].astype(np.int32) << 8) | arr[:, 4]
+    return raw / 160.0
+
+
+def decode_humidity(arr: np.ndarray) -> np.ndarray:
+    """HumiditySensor.decode for each row, in %."""
+    raw = ((arr[:, 4].astype(np.int32) & 0xF0) << 4) | arr[:, 3]
+    return raw / 10.0
+
+
+def decode_light(arr: np.ndarray) -> np.ndarray:
+    """LightSensor.decode for each row."""
+    return (arr[:, 3].astype(np.int32) << 2) | ((arr[:, 4] & 0xC0) >> 6)
+
+
+def decode_rain_rate(arr: np.ndarray) -> np.ndarray:
+    """RainRateSensor.decode for each row, in in/hr (0.0 when it is not raining)."""
+    return _RAIN_RATE_LUT[_bytes34(arr)]
+
+
+def decode_supercap(arr: np.ndarray) -> np.ndarray:
+    """SupercapSensor.decode for each row, in V."""
+    raw = (arr[:, 3].astype(np.int32) << 2) | ((arr[:, 4] & 0xC0) >> 6)
+    return raw / 100.0
+
+
+def decode_uv(arr: np.ndarray) -> np.ndarray:
+    """UVSensor.decode for each row (0.0 when no sensor is present)."""
+    b3 = arr[:, 3]
+    raw = ((b3.astype(np.int32) << 8) | arr[:, 4]) >> 6
+    return np.where(b3 == 0xFF, 0.0, raw / 50.0)
+
+
+def decode_solar(arr: np.ndarray) -> np.ndarray:
+    """SolarSensor.decode for each row, in W/m² (0.0 when no sensor is present)."""
+    return _SOLAR_LUT[_bytes34(arr)]
+
+
+def _bytes34(arr: np.ndarray) -> np.ndarray:
+    """(Byte3 << 8) | Byte4 for each row: an index into the tables below."""
+    return (arr[:, 3].astype(np.int32) << 8) | arr[:, 4]
+
+
+def _rain_rate(b3: np.ndarray, b4: np.ndarray) -> np.ndarray:
+    raw = ((b4 & 0x30) << 4) | b3
+    raining = (b3 != 0xFF) & (raw != 0)
+    return np.divide(
+        _RATE_NUMERATORS[(b4 >> 6) & 1], raw, out=np.zeros(raw.shape), where=raining
+    )
+
+
+def _solar(b3: np.ndarray, b4: np.ndarray) -> np.ndarray:
+    shifted = ((b3 << 8) | b4) >> 4
+    # Clamping at zero covers the scalar decoder's shifted <= 4 early return;
+    # np.rint rounds half to even, like its round()
+    rad = np.rint(np.maximum(shifted - 4, 0) * _INV_2_27)
+    return np.where(b3 == 0xFF, 0.0, rad)
+
+
+# Rain rate and solar are the costliest decoders to vectorize (a masked divide,
+# a round) but depend only on bytes 3 and 4, so each is tabulated once over all
+# 65536 byte pairs and decoding becomes a single gather.
+_B3, _B4 = np.divmod(np.arange(65536, dtype=np.int32), 256)
+_RAIN_RATE_LUT = _rain_rate(_B3, _B4)
+_SOLAR_LUT = _solar(_B3, _B4)
@@ -0,0 +1,56 @@
+import logging
+import unittest
+
+import numpy as np
+
+from . import batch
+from .common import WindDirectionSensor, WindGustSensor, WindSpeedSensor
+from .humidity import HumiditySensor
+from .light import LightSensor
+from .rain_rate import RainRateSensor
+from .solar import SolarSensor
+from .supercap import SupercapSensor
+from .temperature import TemperatureSensor
+from .uv import UVSensor
+
+
+class TestBatchDecoders(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.packets = rng.integers(0, 256, size=(2000, 8), dtype=np.uint8)
+        # Make sure the rain-rate special cases are covered
+        self.packets[:10, 3] = 0xFF
+        self.packets[10:20, 3] = 0
+        self.packets[10:20, 4] &= 0xCF
+
+    def _check(self, batch_fn, sensor_cls):
+        sensor = sensor_cls(logging.getLogger())
+        expected = [sensor.decode(bytes(row)) for row in self.packets]
+        np.testing.assert_array_equal(batch_fn(self.packets), expected)
+
+    def test_matches_per_packet_decoders(self):
+        self._check(batch.decode_wind_speed, WindSpeedSensor)
+        self._check(batch.decode_wind_gust, WindGustSensor)
+        self._check(batch.decode_wind_direction, WindDirectionSensor)
+        self._check(batch.decode_temperature, TemperatureSensor)
+        self._check(batch.decode_humidity, HumiditySensor)
+        self._check(batch.decode_light, LightSensor)
+        self._check(batch.decode_rain_rate, RainRateSensor)
+        self._check(batch.decode_supercap, SupercapSensor)
+        self._check(batch.decode_uv, UVSensor)
+        self._check(batch.decode_solar, SolarSensor)
+
+    def test_as_packet_array(self):
+        rows = [bytes(range(8)), bytes(range(8, 16))]
+        arr = batch.as_packet_array(rows)
+        self.assertEqual(arr.shape, (2, 8))
+        self.assertEqual(arr.dtype, np.uint8)
+        self.assertEqual(bytes(arr[1]), rows[1])
+
+    def test_as_packet_array_rejects_short_packets(self):
+        with self.assertRaises(ValueError):
+            batch.as_packet_array([bytes(8), bytes(7), bytes(9)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,22 @@
-import logging
-from typing import Any, List
+from typing import Any, List, ClassVar
 
 from rtldavis.sensor_classes import AbstractSensor, MQTTSensorConfig
 
+_INDOOR_HUMIDITY = MQTTSensorConfig(
+    id="indoor_humidity",
+    name="Indoor Humidity",
+    device_class="humidity",
+    unit_of_measurement="%",
+    state_class="measurement",
+)
+_BAROMETRIC_PRESSURE = MQTTSensorConfig(
+    id="barometric_pressure",
+    name="Barometric Pressure",
+    device_class="pressure",
+    unit_of_measurement="hPa",
+    state_class="measurement",
+)
+
 class BME280InternalSensor(AbstractSensor):
     """
     Dummy decoder for the local internal BME280.
@@ -11,44 +25,17 @@ class BME280InternalSensor(AbstractSensor):
     published to MQTT and exposed on the REST API transparently.
     """
 
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
-
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            id="indoor_temperature",
-            name="Indoor Temperature",
-            device_class="temperature",
-            unit_of_measurement="°C",
-            state_class="measurement",
-        )
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        id="indoor_temperature",
+        name="Indoor Temperature",
+        device_class="temperature",
+        unit_of_measurement="°C",
+        state_class="measurement",
+    )
 
     @property
     def all_configs(self) -> List[MQTTSensorConfig]:
-        return [
-            MQTTSensorConfig(
-                id="indoor_temperature",
-                name="Indoor Temperature",
-                device_class="temperature",
-                unit_of_measurement="°C",
-                state_class="measurement",
-            ),
-            MQTTSensorConfig(
-                id="indoor_humidity",
-                name="Indoor Humidity",
-                device_class="humidity",
-                unit_of_measurement="%",
-                state_class="measurement",
-            ),
-            MQTTSensorConfig(
-                id="barometric_pressure",
-                name="Barometric Pressure",
-                device_class="pressure",
-                unit_of_measurement="hPa",
-                state_class="measurement",
-            ),
-        ]
+        return [self.config, _INDOOR_HUMIDITY, _BAROMETRIC_PRESSURE]
 
     def decode(self, data: Any) -> Any:
         # BME280 data is passed in already parsed by the bme280 library.
@@ -1,114 +1,128 @@
 """
 Decoders for common (simple) sensor types.
 """
+import logging
 import math
+from typing import ClassVar
 
 from ..sensor_classes import AbstractSensor, MQTTSensorConfig
 
+# Kabuki wind direction in degrees for every 9-bit raw direction
+_WIND_DEG_LUT = tuple(round(raw * 360 / 512) for raw in range(512))
+
+_WIND_DIR_LOG_FMT = "  - Wind Direction: %d° (Byte 2: %d, Byte 4: %d, raw: %d)"
+# Appended to the same record when DEBUG is enabled
+_WIND_DIR_DEBUG_FMT = (
+    "\n  - Wind Direction Calculations:\n"
+    "    - Luc: %.2f°\n"
+    "    - Dekay: %.2f°\n"
+    "    - Dario: %.2f°\n"
+    "    - Kabuki: %d° (used)\n"
+    "    - Rdsman: %d°"
+)
+
 
 class WindSpeedSensor(AbstractSensor):
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="Wind Speed",
-            id="wind_speed",
-            device_class="wind_speed",
-            unit_of_measurement="km/h",
-            state_class="measurement",
-        )
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="Wind Speed",
+        id="wind_speed",
+        device_class="wind_speed",
+        unit_of_measurement="km/h",
+        state_class="measurement",
+    )
 
     def decode(self, data: bytes) -> float:
         mph = data[1]
         kmh = round(mph * 1.60934, 1)
-        self.logger.info(f"  - Byte 1 (Wind Speed): {mph} mph -> {kmh} km/h")
+        self.logger.info("  - Byte 1 (Wind Speed): %d mph -> %s km/h", mph, kmh)
         return kmh
 
 
 class WindDirectionSensor(AbstractSensor):
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="Wind Direction",
-            id="wind_direction",
-            device_class="wind_direction",
-            unit_of_measurement="°",
-            state_class="measurement_angle",
-            icon="mdi:compass-rose",
-        )
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="Wind Direction",
+        id="wind_direction",
+        device_class="wind_direction",
+        unit_of_measurement="°",
+        state_class="measurement_angle",
+        icon="mdi:compass-rose",
+    )
 
     def decode(self, data: bytes) -> int:
+        # From https://www.wxforum.net/index.php?topic=22189.msg247945#msg247945
+        raw_direction = (data[2] << 1) | ((data[4] & 2) >> 1)
+        kabuki_wind_dir = _WIND_DEG_LUT[raw_direction]
+
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.info(
+                _WIND_DIR_LOG_FMT, kabuki_wind_dir, data[2], data[4], raw_direction
+            )
+            return kabuki_wind_dir
+
+        # Alternative formulas, only computed for comparison in the log
         # From https://github.com/lheijst/weewx-rtldavis/blob/master/bin/user/rtldavis.py#L1049-L1059
         luc_wind_dir = data[2] * 1.40625 + 0.3
         # From https://github.com/dekay/im-me/blob/master/pocketwx/src/protocol.txt
         dekay_wind_dir = data[2] * 360 / 255
         # From https://www.carluccio.de/davis-vue-hacking-part-2/
         dario_wind_dir = 9 + data[2] * 342 / 255
-
-        # From https://www.wxforum.net/index.php?topic=22189.msg247945#msg247945
-        raw_direction = (data[2] << 1) | ((data[4] & 2) >> 1)
-        kabuki_wind_dir = round(raw_direction * 360 / 512)
         rdsman_wind_dir = round(raw_direction * 0.3515625)
 
         self.logger.info(
-            f"  - Wind Direction Calculations:\n"
-            f"    - Raw Byte 2: {data[2]}\n"
-            f"    - Raw Byte 4: {data[4]}\n"
-            f"    - Luc: {luc_wind_dir:.2f}°\n"
-            f"    - Dekay: {dekay_wind_dir:.2f}°\n"
-            f"    - Dario: {dario_wind_dir:.2f}°\n"
-            f"    - Kabuki (raw): {raw_direction}\n"
-            f"    - Kabuki: {kabuki_wind_dir}° (used)\n"
-            f"    - Rdsman: {rdsman_wind_dir}°"
+            _WIND_DIR_LOG_FMT + _WIND_DIR_DEBUG_FMT,
+            kabuki_wind_dir,
+            data[2],
+            data[4],
+            raw_direction,
+            luc_wind_dir,
+            dekay_wind_dir,
+            dario_wind_dir,
+            kabuki_wind_dir,
+            rdsman_wind_dir,
         )
 
         return kabuki_wind_dir
 
 
 class WindGustSensor(AbstractSensor):
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="Wind Gust",
-            id="wind_gust_speed",
-            device_class="wind_speed",
-            unit_of_measurement="km/h",
-            state_class="measurement",
-        )
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="Wind Gust",
+        id="wind_gust_speed",
+        device_class="wind_speed",
+        unit_of_measurement="km/h",
+        state_class="measurement",
+    )
 
     def decode(self, data: bytes) -> float:
         mph = data[3]
         kmh = round(mph * 1.60934, 1)
-        self.logger.info(f"  - Byte 3 (Wind Gust): {mph} mph -> {kmh} km/h")
+        self.logger.info("  - Byte 3 (Wind Gust): %d mph -> %s km/h", mph, kmh)
         return kmh
 
 
 class RSSISensor(AbstractSensor):
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="RSSI",
-            id="rssi",
-            device_class="signal_strength",
-            unit_of_measurement="dB",
-            state_class="measurement",
-            diagnostic=True,
-        )
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="RSSI",
+        id="rssi",
+        device_class="signal_strength",
+        unit_of_measurement="dB",
+        state_class="measurement",
+        diagnostic=True,
+    )
 
     def decode(self, data: float) -> float:
         return data
 
 
 class SNRSensor(AbstractSensor):
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="SNR",
-            id="snr",
-            device_class="signal_strength",
-            unit_of_measurement="dB",
-            state_class="measurement",
-            diagnostic=True,
-        )
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="SNR",
+        id="snr",
+        device_class="signal_strength",
+        unit_of_measurement="dB",
+        state_class="measurement",
+        diagnostic=True,
+    )
 
     def decode(self, data: float) -> float:
         return data
@@ -0,0 +1,21 @@
+import logging
+import unittest
+
+from .common import WindDirectionSensor
+
+
+class TestWindDirectionDecoder(unittest.TestCase):
+    def setUp(self):
+        self.decoder = WindDirectionSensor(logging.getLogger())
+
+    def test_lookup_matches_float_formula(self):
+        # Every 9-bit raw direction: Byte 2 holds the top 8 bits, bit 1 of Byte 4 the LSB
+        for raw_direction in range(512):
+            data = bytes([0, 0, raw_direction >> 1, 0, (raw_direction & 1) << 1, 0])
+            self.assertEqual(
+                self.decoder.decode(data), round(raw_direction * 360 / 512), raw_direction
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+import unittest
+
+from .. import decoders
+from ..sensor_classes import AbstractSensor
+
+
+class TestDecoderExports(unittest.TestCase):
+    def test_all_lists_every_sensor_class(self):
+        sensor_classes = {
+            name
+            for name, value in vars(decoders).items()
+            if isinstance(value, type) and issubclass(value, AbstractSensor)
+        }
+        self.assertEqual(sorted(decoders.__all__), sorted(sensor_classes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,22 +1,25 @@
 """
 Decoder for Davis humidity data.
 """
-import logging
+from typing import ClassVar
 from ..sensor_classes import AbstractSensor, MQTTSensorConfig
 
-class HumiditySensor(AbstractSensor):
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
+_LOG_FMT = (
+    "  - Humidity Data (Bytes 3-4):\n"
+    "    - Raw Value: 0x%03X (%d)\n"
+    "    - Formula: ((((Byte4 >> 4) << 8) + Byte3) / 10.0)\n"
+    "    - Humidity: %.1f%%"
+)
+
 
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="Humidity",
-            id="humidity",
-            device_class="humidity",
-            unit_of_measurement="%",
-            state_class="measurement",
-        )
+class HumiditySensor(AbstractSensor):
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="Humidity",
+        id="humidity",
+        device_class="humidity",
+        unit_of_measurement="%",
+        state_class="measurement",
+    )
 
     def decode(self, data: bytes) -> float:
         """
@@ -25,14 +28,12 @@ class HumiditySensor(AbstractSensor):
         From https://github.com/dekay/DavisRFM69/wiki/Message-Protocol:
         > humidity = (((Byte4 >> 4) << 8) + Byte3) / 10.0
         """
-        raw_humidity = ((data[4] >> 4) << 8) + data[3]
-        humidity = float(raw_humidity) / 10.0
+        # Same value as the formula above: the high nibble of Byte4 masked in place
+        raw_humidity = ((data[4] & 0xF0) << 4) | data[3]
+        # True division already yields a float; it also stays correctly rounded,
+        # where raw * 0.1 would publish values like 72.10000000000001
+        humidity = raw_humidity / 10.0
         
-        self.logger.info(
-            f"  - Humidity Data (Bytes 3-4):\n"
-            f"    - Raw Value: 0x{raw_humidity:03X} ({raw_humidity})\n"
-            f"    - Formula: ((((Byte4 >> 4) << 8) + Byte3) / 10.0)\n"
-            f"    - Humidity: {humidity:.1f}%"
-        )
+        self.logger.info(_LOG_FMT, raw_humidity, raw_humidity, humidity)
 
         return humidity
@@ -1,35 +1,32 @@
 """
 Decoder for Davis light data.
 """
-import logging
+from typing import ClassVar
 from ..sensor_classes import AbstractSensor, MQTTSensorConfig
 
-class LightSensor(AbstractSensor):
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
+_LOG_FMT = (
+    "  - Light Data (Bytes 3-4):\n"
+    "    - Raw Value: 0x%03X (%d)\n"
+    "    - Formula: (Byte3 * 4) + ((Byte4 & 0xC0) / 64)\n"
+    "    - Light: %d"
+)
+
 
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="Light",
-            id="light",
-            device_class="illuminance",
-            unit_of_measurement="lx",
-            state_class="measurement",
-        )
+class LightSensor(AbstractSensor):
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="Light",
+        id="light",
+        device_class="illuminance",
+        unit_of_measurement="lx",
+        state_class="measurement",
+    )
 
-    def decode(self, data: bytes) -> float:
+    def decode(self, data: bytes) -> int:
         """
         Decodes light from a raw data packet.
         """
-        raw_light = (data[3] << 2) + ((data[4] & 0xC0) >> 6)
-        light = float(raw_light)
-        
-        self.logger.info(
-            f"  - Light Data (Bytes 3-4):\n"
-            f"    - Raw Value: 0x{raw_light:03X} ({raw_light})\n"
-            f"    - Formula: (Byte3 * 4) + ((Byte4 & 0xC0) / 64)\n"
-            f"    - Light: {light}"
-        )
+        raw_light = (data[3] << 2) | ((data[4] & 0xC0) >> 6)
+
+        self.logger.info(_LOG_FMT, raw_light, raw_light, raw_light)
 
-        return light
+        return raw_light
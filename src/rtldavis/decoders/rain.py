@@ -2,11 +2,23 @@
 Decoder for Davis rain total data.
 """
 import logging
-from typing import Optional, Deque
+from typing import Optional, Deque, Tuple, ClassVar
 from collections import deque
 import time
 from ..sensor_classes import AbstractSensor, MQTTSensorConfig
 
+# One record per packet: INFO normally, a WARNING carrying the same data on rollover
+_LOG_FMT = (
+    "  - Rain Data (Byte 3):\n"
+    "    - Raw Click Counter: %d\n"
+    "    - Cumulative Clicks (Raw): %d\n"
+    "    - Total Rainfall (Raw): %.2f inches"
+)
+_ROLLOVER_LOG_FMT = (
+    "    - Rollover detected! (Last: %d, Current: %d). "
+    "Clicks since last: %d. Total rollovers: %d. Raw message type 3 value: %d\n"
+) + _LOG_FMT
+
 _RAIN_TOTAL_HOURLY = MQTTSensorConfig(
     name="Rain Total Hourly",
     id="rain_total_hourly",
@@ -36,23 +48,42 @@ class RainTotalSensor(AbstractSensor):
     """
     A stateful decoder for cumulative rain total from a Davis weather station.
     """
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="Rain Total Raw",
+        id="rain_total_raw",
+        device_class="precipitation",
+        unit_of_measurement="in",
+        state_class="total_increasing",
+        icon="mdi:weather-pouring",
+    )
+
+    __slots__ = (
+        "last_clicks",
+        "total_clicks_raw",
+        "rollover_count",
+        "clicks_history",
+        "_daily_history",
+        "_hourly_history",
+        "_weekly_clicks",
+        "_daily_clicks",
+        "_hourly_clicks",
+    )
+
     def __init__(self, logger: logging.Logger):
         super().__init__(logger)
         self.last_clicks: Optional[int] = None
         self.total_clicks_raw: int = 0
         self.rollover_count: int = 0
-        self.clicks_history: Deque[float] = deque()
-
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="Rain Total Raw",
-            id="rain_total_raw",
-            device_class="precipitation",
-            unit_of_measurement="in",
-            state_class="total_increasing",
-            icon="mdi:weather-pouring",
-        )
+        # (timestamp, clicks) per packet that advanced the counter, for the last
+        # week, day and hour, with a running click total per window. Each window
+        # only ever drops entries from its old end, so no count needs a scan of
+        # the week's history.
+        self.clicks_history: Deque[Tuple[int, int]] = deque()
+        self._daily_history: Deque[Tuple[int, int]] = deque()
+        self._hourly_history: Deque[Tuple[int, int]] = deque()
+        self._weekly_clicks: int = 0
+        self._daily_clicks: int = 0
+        self._hourly_clicks: int = 0
 
     @property
     def all_configs(self) -> list[MQTTSensorConfig]:
@@ -63,44 +94,65 @@ class RainTotalSensor(AbstractSensor):
         Decodes the cumulative rain total from a raw data packet.
         """
         current_clicks = data[3] & 0x7F
-        
-        self.logger.info(f"  - Rain Data (Byte 3):\n    - Raw Click Counter: {current_clicks}")
+        # Monotonic: the rolling windows below must not jump when NTP steps the wall clock.
+        # Whole seconds are ample for hour-long and longer windows and keep the
+        # window comparisons in integer arithmetic.
+        now = int(time.monotonic())
 
-        if self.last_clicks is not None and current_clicks < self.last_clicks:
+        last_clicks = self.last_clicks
+        rolled_over = last_clicks is not None and current_clicks < last_clicks
+        if rolled_over:
             self.rollover_count += 1
-            clicks_since_last = (128 - self.last_clicks) + current_clicks
-            self.logger.warning(
-                f"    - Rollover detected! (Last: {self.last_clicks}, Current: {current_clicks}). "
-                f"Clicks since last: {clicks_since_last}. Total rollovers: {self.rollover_count}"
-            )
+            clicks_since_last = (128 - last_clicks) + current_clicks
             # Per user request, do not add this anomalous value to the total, just log it
-            self.logger.info(f"    - Raw message type 3 value: {data[3]}")
-        elif self.last_clicks is not None:
-            clicks_since_last = current_clicks - self.last_clicks
+        elif last_clicks is not None:
+            clicks_since_last = current_clicks - last_clicks
             if clicks_since_last > 0:
                 self.total_clicks_raw += clicks_since_last
-                now = time.time()
-                for _ in range(clicks_since_last):
-                    self.clicks_history.append(now)
+                entry = (now, clicks_since_last)
+                self.clicks_history.append(entry)
+                self._daily_history.append(entry)
+                self._hourly_history.append(entry)
+                self._weekly_clicks += clicks_since_last
+                self._daily_clicks += clicks_since_last
+                self._hourly_clicks += clicks_since_last
         
         self.last_clicks = current_clicks
         
         total_inches = self.total_clicks_raw * 0.01
 
-        self.logger.info(f"    - Cumulative Clicks (Raw): {self.total_clicks_raw}")
-        self.logger.info(f"    - Total Rainfall (Raw): {total_inches:.2f} inches")
+        if rolled_over:
+            self.logger.warning(
+                _ROLLOVER_LOG_FMT,
+                last_clicks,
+                current_clicks,
+                clicks_since_last,
+                self.rollover_count,
+                data[3],
+                current_clicks,
+                self.total_clicks_raw,
+                total_inches,
+            )
+        else:
+            self.logger.info(_LOG_FMT, current_clicks, self.total_clicks_raw, total_inches)
 
-        now = time.time()
         one_hour_ago = now - 3600
         one_day_ago = now - 86400
         one_week_ago = now - 604800
 
-        while self.clicks_history and self.clicks_history[0] < one_week_ago:
-            self.clicks_history.popleft()
-        
-        hourly_clicks = sum(1 for t in self.clicks_history if t > one_hour_ago)
-        daily_clicks = sum(1 for t in self.clicks_history if t > one_day_ago)
-        weekly_clicks = len(self.clicks_history)
+        weekly = self.clicks_history
+        while weekly and weekly[0][0] < one_week_ago:
+            self._weekly_clicks -= weekly.popleft()[1]
+        daily = self._daily_history
+        while daily and daily[0][0] <= one_day_ago:
+            self._daily_clicks -= daily.popleft()[1]
+        hourly = self._hourly_history
+        while hourly and hourly[0][0] <= one_hour_ago:
+            self._hourly_clicks -= hourly.popleft()[1]
+
+        hourly_clicks = self._hourly_clicks
+        daily_clicks = self._daily_clicks
+        weekly_clicks = self._weekly_clicks
 
         return {
             "rain_total_raw": total_inches,
@@ -1,53 +1,53 @@
 """
 Decoder for Davis rain rate data.
 """
-import logging
+from typing import ClassVar
 from ..sensor_classes import AbstractSensor, MQTTSensorConfig
 
+# Indexed by bit 6 of byte 4: in strong rain the time value is in 1/16 s units
+_RAIN_TYPES = ("Light", "Strong")
+_CLICK_TIME_DIVISORS = (1.0, 16.0)
+
+_LOG_FMT = (
+    "  - Rain Rate Data (Bytes 3-4):\n"
+    "    - Raw time value: %d\n"
+    "    - Rain Type: %s\n"
+    "    - Time between clicks: %.4f s\n"
+    "    - Rain Rate: %.3f in/hr"
+)
+_NO_RAIN_LOG_FMT = "  - Rain Rate Data (Bytes 3-4):\n    - No rain detected (%s)"
+
 class RainRateSensor(AbstractSensor):
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
-
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="Rain Rate",
-            id="rain_rate",
-            device_class="precipitation_intensity",
-            unit_of_measurement="in/h",
-            state_class="measurement",
-            icon="mdi:weather-rainy",
-        )
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="Rain Rate",
+        id="rain_rate",
+        device_class="precipitation_intensity",
+        unit_of_measurement="in/h",
+        state_class="measurement",
+        icon="mdi:weather-rainy",
+    )
 
     def decode(self, data: bytes) -> float:
         """
         Decodes rain rate from a raw data packet.
         """
-        raw_val = (((data[4] & 0x30) >> 4) * 256) + data[3]
-        
-        self.logger.info(f"  - Rain Rate Data (Bytes 3-4):\n    - Raw time value: {raw_val}")
-
+        # Byte3 == 0xFF is the usual dry-weather packet; settle it before building raw_val
         if data[3] == 0xFF:
-            self.logger.info("    - No rain detected (Byte3 == 0xFF)")
+            self.logger.info(_NO_RAIN_LOG_FMT, "Byte3 == 0xFF")
             return 0.0
 
+        raw_val = ((data[4] & 0x30) << 4) | data[3]
+
         if raw_val == 0:
-            self.logger.info("    - No rain detected (raw time value is 0)")
+            self.logger.info(_NO_RAIN_LOG_FMT, "raw time value is 0")
             return 0.0
 
-        is_strong_rain = (data[4] & 0x40) != 0
-        rain_type = "Strong" if is_strong_rain else "Light"
-        self.logger.info(f"    - Rain Type: {rain_type}")
-
-        if is_strong_rain:
-            time_between_clicks = float(raw_val) / 16.0
-        else:
-            time_between_clicks = float(raw_val)
-
-        self.logger.info(f"    - Time between clicks: {time_between_clicks:.4f} s")
-
+        strong_rain = (data[4] >> 6) & 1
+        time_between_clicks = raw_val / _CLICK_TIME_DIVISORS[strong_rain]
         inches_per_hour = 36.0 / time_between_clicks
 
-        self.logger.info(f"    - Rain Rate: {inches_per_hour:.3f} in/hr")
+        self.logger.info(
+            _LOG_FMT, raw_val, _RAIN_TYPES[strong_rain], time_between_clicks, inches_per_hour
+        )
 
         return inches_per_hour
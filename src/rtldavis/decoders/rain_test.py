@@ -1,5 +1,6 @@
 import logging
 import unittest
+from unittest import mock
 
 from .rain import RainTotalSensor
 from .rain_rate import RainRateSensor
@@ -41,6 +42,31 @@ class TestRainTotalDecoder(unittest.TestCase):
         for key in ("rain_total_raw", "rain_total_hourly", "rain_total_daily", "rain_total_weekly"):
             self.assertIn(key, result)
 
+    def test_rolling_windows_expire_old_clicks(self):
+        with mock.patch("rtldavis.decoders.rain.time.monotonic") as clock:
+            clock.return_value = 0.0
+            self.decoder.decode(_packet(0x00))  # baseline
+            self.decoder.decode(_packet(0x02))  # 2 clicks at t=0
+            clock.return_value = 3000.0
+            result = self.decoder.decode(_packet(0x05))  # 3 more clicks
+            self.assertEqual(round(result["rain_total_hourly"] * 100), 5)
+
+            clock.return_value = 3600.0  # the first two clicks leave the hour
+            result = self.decoder.decode(_packet(0x05))
+            self.assertEqual(round(result["rain_total_hourly"] * 100), 3)
+            self.assertEqual(round(result["rain_total_daily"] * 100), 5)
+
+            clock.return_value = 3000.0 + 86400.0  # all leave the day
+            result = self.decoder.decode(_packet(0x05))
+            self.assertEqual(round(result["rain_total_hourly"] * 100), 0)
+            self.assertEqual(round(result["rain_total_daily"] * 100), 0)
+            self.assertEqual(round(result["rain_total_weekly"] * 100), 5)
+
+            clock.return_value = 3001.0 + 604800.0  # and the week
+            result = self.decoder.decode(_packet(0x05))
+            self.assertEqual(round(result["rain_total_weekly"] * 100), 0)
+            self.assertAlmostEqual(result["rain_total_raw"], 0.05, delta=0.001)
+
 
 class TestRainRateDecoder(unittest.TestCase):
     def setUp(self):
@@ -1,23 +1,31 @@
 """
 Decoder for Davis solar radiation data.
 """
-import logging
+from typing import ClassVar
 from ..sensor_classes import AbstractSensor, MQTTSensorConfig
 
+_LOG_FMT = (
+    "  - Solar Radiation Data (Bytes 3-4):\n"
+    "    - Raw 16-bit Value: 0x%04X\n"
+    "    - Value >> 4: 0x%03X (%d)\n"
+    "    - Formula: round(((VALUE >> 4) - 4) / 2.27)\n"
+    "    - Solar Radiation: %.1f W/m^2"
+)
+
+# Multiplying by the reciprocal rounds to the same whole W/m^2 as dividing by
+# 2.27 for every possible 12-bit value
+_INV_2_27 = 1.0 / 2.27
+
+
 class SolarSensor(AbstractSensor):
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
-
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="Solar Radiation",
-            id="solar_radiation",
-            device_class="irradiance",
-            unit_of_measurement="W/m²",
-            state_class="measurement",
-            icon="mdi:weather-sunny",
-        )
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="Solar Radiation",
+        id="solar_radiation",
+        device_class="irradiance",
+        unit_of_measurement="W/m²",
+        state_class="measurement",
+        icon="mdi:weather-sunny",
+    )
 
     def decode(self, data: bytes) -> float:
         """
@@ -27,21 +35,15 @@ class SolarSensor(AbstractSensor):
             self.logger.info("    - No solar sensor detected")
             return 0.0
 
-        raw_value = (data[3] << 8) + data[4]
+        raw_value = (data[3] << 8) | data[4]
         
         value_shifted = raw_value >> 4
         
         if value_shifted <= 4:
             return 0.0
 
-        solar_rad = round(((value_shifted) - 4) / 2.27)
+        solar_rad = round((value_shifted - 4) * _INV_2_27)
         
-        self.logger.info(
-            f"  - Solar Radiation Data (Bytes 3-4):\n"
-            f"    - Raw 16-bit Value: 0x{raw_value:04X}\n"
-            f"    - Value >> 4: 0x{value_shifted:03X} ({value_shifted})\n"
-            f"    - Formula: round(((VALUE >> 4) - 4) / 2.27)\n"
-            f"    - Solar Radiation: {solar_rad:.1f} W/m^2"
-        )
+        self.logger.info(_LOG_FMT, raw_value, value_shifted, value_shifted, solar_rad)
 
         return float(solar_rad)
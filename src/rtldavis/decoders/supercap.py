@@ -1,35 +1,33 @@
 """
 Decoder for Davis supercap voltage data.
 """
-import logging
+from typing import ClassVar
 from ..sensor_classes import AbstractSensor, MQTTSensorConfig
 
-class SupercapSensor(AbstractSensor):
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
+_LOG_FMT = (
+    "  - Supercap Voltage Data (Bytes 3-4):\n"
+    "    - Raw Value: 0x%03X (%d)\n"
+    "    - Formula: ((Byte3 << 2) + ((Byte4 & 0xC0) >> 6)) / 100.0\n"
+    "    - Supercap Voltage: %.2f V"
+)
+
 
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="Supercap Voltage",
-            id="super_cap_voltage",
-            device_class="voltage",
-            unit_of_measurement="V",
-            state_class="measurement",
-        )
+class SupercapSensor(AbstractSensor):
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="Supercap Voltage",
+        id="super_cap_voltage",
+        device_class="voltage",
+        unit_of_measurement="V",
+        state_class="measurement",
+    )
 
     def decode(self, data: bytes) -> float:
         """
         Decodes the supercap voltage from a raw data packet.
         """
-        raw_voltage = (data[3] << 2) + ((data[4] & 0xC0) >> 6)
-        voltage = float(raw_voltage) / 100.0
+        raw_voltage = (data[3] << 2) | ((data[4] & 0xC0) >> 6)
+        voltage = raw_voltage / 100.0
         
-        self.logger.info(
-            f"  - Supercap Voltage Data (Bytes 3-4):\n"
-            f"    - Raw Value: 0x{raw_voltage:03X} ({raw_voltage})\n"
-            f"    - Formula: ((Byte3 << 2) + ((Byte4 & 0xC0) >> 6)) / 100.0\n"
-            f"    - Supercap Voltage: {voltage:.2f} V"
-        )
+        self.logger.info(_LOG_FMT, raw_voltage, raw_voltage, voltage)
 
         return voltage
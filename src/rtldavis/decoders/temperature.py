@@ -2,23 +2,25 @@
 Decoder for Davis temperature data.
 """
 
-import logging
+from typing import ClassVar
 from ..sensor_classes import AbstractSensor, MQTTSensorConfig
 
+_LOG_FMT = (
+    "  - Temperature Data:\n"
+    "    - Raw Value (Bytes 3-4): 0x%04X (%d)\n"
+    "    - Formula: %d / 160.0\n"
+    "    - Temperature: %.1f°F"
+)
+
 
 class TemperatureSensor(AbstractSensor):
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
-
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="Temperature",
-            id="temperature",
-            device_class="temperature",
-            unit_of_measurement="°F",
-            state_class="measurement",
-        )
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="Temperature",
+        id="temperature",
+        device_class="temperature",
+        unit_of_measurement="°F",
+        state_class="measurement",
+    )
 
     def decode(self, data: bytes) -> float:
         """
@@ -28,12 +30,8 @@ class TemperatureSensor(AbstractSensor):
         > tempF = ((Byte3 * 256 + Byte4) / 160
         """
         raw_temp = (data[3] << 8) | data[4]
-        temp_f = float(raw_temp) / 160.0
+        temp_f = raw_temp / 160.0
 
-        log_msg = f"  - Temperature Data:\n"
-        log_msg += f"    - Raw Value (Bytes 3-4): 0x{raw_temp:04X} ({raw_temp})\n"
-        log_msg += f"    - Formula: {raw_temp} / 160.0\n"
-        log_msg += f"    - Temperature: {temp_f:.1f}°F"
-        self.logger.info(log_msg)
+        self.logger.info(_LOG_FMT, raw_temp, raw_temp, raw_temp, temp_f)
 
         return temp_f
@@ -2,24 +2,26 @@
 Decoder for Davis UV index data.
 """
 
-import logging
+from typing import ClassVar
 from ..sensor_classes import AbstractSensor, MQTTSensorConfig
 
+_LOG_FMT = (
+    "  - UV Index Data:\n"
+    "    - Raw Value (Bytes 3-4 >> 6): 0x%03X (%d)\n"
+    "    - Formula: %d / 50.0\n"
+    "    - UV Index: %.1f"
+)
+
 
 class UVSensor(AbstractSensor):
-    def __init__(self, logger: logging.Logger):
-        super().__init__(logger)
-
-    @property
-    def config(self) -> MQTTSensorConfig:
-        return MQTTSensorConfig(
-            name="UV Index",
-            id="uv_index",
-            device_class="uv_index",
-            unit_of_measurement="UV index",
-            state_class="measurement",
-            icon="mdi:sun-wireless",
-        )
+    config: ClassVar[MQTTSensorConfig] = MQTTSensorConfig(
+        name="UV Index",
+        id="uv_index",
+        device_class="uv_index",
+        unit_of_measurement="UV index",
+        state_class="measurement",
+        icon="mdi:sun-wireless",
+    )
 
     def decode(self, data: bytes) -> float:
         """
@@ -36,13 +38,9 @@ class UVSensor(AbstractSensor):
             self.logger.info("    - No UV sensor detected")
             return 0.0
 
-        raw_uv = ((data[3] << 8) + data[4]) >> 6
-        uv_index = float(raw_uv) / 50.0
+        raw_uv = ((data[3] << 8) | data[4]) >> 6
+        uv_index = raw_uv / 50.0
 
-        log_msg = f"  - UV Index Data:\n"
-        log_msg += f"    - Raw Value (Bytes 3-4 >> 6): 0x{raw_uv:03X} ({raw_uv})\n"
-        log_msg += f"    - Formula: {raw_uv} / 50.0\n"
-        log_msg += f"    - UV Index: {uv_index:.1f}"
-        self.logger.info(log_msg)
+        self.logger.info(_LOG_FMT, raw_uv, raw_uv, raw_uv, uv_index)
 
         return uv_index
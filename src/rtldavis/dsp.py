@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 import logging
 import math
-import struct
-from typing import List
+from typing import List, Optional
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .jit import HAS_NUMBA, njit
 
 logger = logging.getLogger(__name__)
 
@@ -20,10 +22,13 @@ class Packet:
 class ByteToCmplxLUT:
     """
     A lookup table to convert byte values from the RTL-SDR to complex numbers.
+    The dongle only delivers 8 bits per component, so single precision is exact enough.
     """
 
     def __init__(self) -> None:
-        self.lut: np.ndarray = (np.arange(256, dtype=np.float64) - 127.4) / 127.6
+        self.lut: np.ndarray = ((np.arange(256, dtype=np.float64) - 127.4) / 127.6).astype(
+            np.float32
+        )
 
     def execute(self, in_bytes: np.ndarray, out_cmplx: np.ndarray) -> None:
         """
@@ -44,38 +49,44 @@ def rotate_fs4(in_cmplx: np.ndarray, out_cmplx: np.ndarray) -> None:
     Rotates the complex signal by Fs/4.
     """
     out_cmplx[0::4] = in_cmplx[0::4]
-    out_cmplx[1::4] = in_cmplx[1::4] * 1j
-    out_cmplx[2::4] = in_cmplx[2::4] * -1
-    out_cmplx[3::4] = in_cmplx[3::4] * -1j
+    np.multiply(in_cmplx[1::4], 1j, out=out_cmplx[1::4])
+    np.negative(in_cmplx[2::4], out=out_cmplx[2::4])
+    np.multiply(in_cmplx[3::4], -1j, out=out_cmplx[3::4])
+
+
+FIR9_COEFFS = np.array(
+    [
+        0.017682261285,
+        0.048171339939,
+        0.122424706672,
+        0.197408519126,
+        0.228626345955,
+        0.197408519126,
+        0.122424706672,
+        0.048171339939,
+        0.017682261285,
+    ],
+    dtype=np.float32,
+)
 
 
 def fir9(in_cmplx: np.ndarray, out_cmplx: np.ndarray) -> None:
     """
     A 9-tap FIR filter.
     """
-    coeffs = np.array(
-        [
-            0.017682261285,
-            0.048171339939,
-            0.122424706672,
-            0.197408519126,
-            0.228626345955,
-            0.197408519126,
-            0.122424706672,
-            0.048171339939,
-            0.017682261285,
-        ],
-        dtype=np.float64,
-    )
-
-    result = np.convolve(in_cmplx, coeffs, mode="valid")
+    result = np.convolve(in_cmplx, FIR9_COEFFS, mode="valid")
     n = out_cmplx.size
     out_cmplx[:] = result[:n]
 
 
-def discriminate(in_cmplx: np.ndarray, out_float: np.ndarray) -> None:
+def discriminate(
+    in_cmplx: np.ndarray, out_float: np.ndarray, scratch: Optional[np.ndarray] = None
+) -> None:
     """
     An FSK demodulator.
+
+    scratch is an optional (2, len(in_cmplx) - 1) float array reused for the
+    intermediate products; the numerator is built directly in out_float.
     """
     n = in_cmplx[:-1]
     np_ = in_cmplx[1:]
@@ -85,17 +96,132 @@ def discriminate(in_cmplx: np.ndarray, out_float: np.ndarray) -> None:
     real_np = np_.real
     imag_np = np_.imag
 
+    size = n.size
+    if scratch is None:
+        scratch = np.empty((2, size), dtype=out_float.dtype)
+    num = out_float[:size]
+    tmp, den = scratch[0, :size], scratch[1, :size]
+
     epsilon = 1e-10
-    result = (imag_n * real_np - real_n * imag_np) / (real_n**2 + imag_n**2 + epsilon)
-    out_float[: len(result)] = result
+    np.multiply(imag_n, real_np, out=num)
+    np.multiply(real_n, imag_np, out=tmp)
+    np.subtract(num, tmp, out=num)
+    np.multiply(real_n, real_n, out=den)
+    np.multiply(imag_n, imag_n, out=tmp)
+    np.add(den, tmp, out=den)
+    np.add(den, epsilon, out=den)
+    np.divide(num, den, out=num)
+
+
+def _mean_power(iq: np.ndarray) -> float:
+    """
+    Mean |x|^2 of a complex64 array: the sum of squares of its interleaved float32
+    parts, as one dot product with no sqrt and no temporary array.
+    """
+    parts = iq.view(np.float32)
+    return float(parts.dot(parts)) / iq.size
 
 
 def quantize(in_float: np.ndarray, out_byte: np.ndarray) -> None:
     """
-    Converts the demodulated signal into a stream of bits.
+    Converts the demodulated signal into a stream of bits: 1 where the sample's
+    sign bit is set, 0 otherwise.
     """
-    for i, val in enumerate(in_float):
-        out_byte[i] = struct.unpack("Q", struct.pack("d", val))[0] >> 63
+    np.signbit(in_float, out=out_byte[: in_float.size].view(np.bool_))
+
+
+@njit(
+    "void(complex64[:], complex64[:], float32[:], uint8[:], float32[:])",
+    cache=True,
+    fastmath=True,
+    boundscheck=False,
+    nogil=True,
+)
+def _filter_discriminate(iq, filtered, out_float, out_byte, coeffs):  # pragma: no cover - compiled
+    """fir9 -> discriminate -> quantize over already rotated samples."""
+    n = out_float.size
+
+    # The taps are symmetric: add each mirrored pair of samples before multiplying
+    c0, c1, c2, c3, c4 = coeffs[0], coeffs[1], coeffs[2], coeffs[3], coeffs[4]
+    for i in range(n):
+        filtered[i + 1] = (
+            (iq[i] + iq[i + 8]) * c0
+            + (iq[i + 1] + iq[i + 7]) * c1
+            + (iq[i + 2] + iq[i + 6]) * c2
+            + (iq[i + 3] + iq[i + 5]) * c3
+            + iq[i + 4] * c4
+        )
+
+    for i in range(n):
+        a = filtered[i]
+        b = filtered[i + 1]
+        val = (a.imag * b.real - a.real * b.imag) / (
+            a.real * a.real + a.imag * a.imag + np.float32(1e-10)
+        )
+        out_float[i] = val
+        out_byte[i] = 1 if val < 0 else 0
+
+
+@njit(
+    "void(complex64[:], complex64[:], float32[:], uint8[:], float32[:])",
+    cache=True,
+    fastmath=True,
+    boundscheck=False,
+    nogil=True,
+)
+def _demod_core(iq, filtered, out_float, out_byte, coeffs):  # pragma: no cover - compiled
+    """
+    Fused rotate_fs4 -> fir9 -> discriminate -> quantize for one block.
+
+    iq holds 9 samples of history followed by the new block; filtered[0] is the
+    last filtered sample of the previous block. Equivalent to the NumPy chain in
+    Demodulator.demodulate, but without any intermediate arrays.
+    """
+    ntaps = coeffs.size
+
+    for i in range(iq.size - ntaps):
+        k = i & 3
+        s = iq[ntaps + i]
+        if k == 1:
+            iq[ntaps + i] = complex(-s.imag, s.real)
+        elif k == 2:
+            iq[ntaps + i] = -s
+        elif k == 3:
+            iq[ntaps + i] = complex(s.imag, -s.real)
+
+    _filter_discriminate(iq, filtered, out_float, out_byte, coeffs)
+
+
+@njit(
+    "void(uint8[:], float32[:], complex64[:], complex64[:], float32[:], uint8[:], float32[:])",
+    cache=True,
+    fastmath=True,
+    boundscheck=False,
+    nogil=True,
+)
+def _demod_bytes_core(
+    in_bytes, lut, iq, filtered, out_float, out_byte, coeffs
+):  # pragma: no cover - compiled
+    """
+    _demod_core for raw interleaved I/Q bytes: the ByteToCmplxLUT conversion is
+    done in the same pass as the Fs/4 rotation, writing each sample into iq once.
+    """
+    ntaps = coeffs.size
+
+    for i in range(iq.size - ntaps):
+        k = i & 3
+        re = lut[in_bytes[2 * i]]
+        im = lut[in_bytes[2 * i + 1]]
+        if k == 0:
+            iq[ntaps + i] = complex(re, im)
+        elif k == 1:
+            iq[ntaps + i] = complex(-im, re)
+        elif k == 2:
+            iq[ntaps + i] = complex(-re, -im)
+        else:
+            iq[ntaps + i] = complex(im, -re)
+
+    _filter_discriminate(iq, filtered, out_float, out_byte, coeffs)
 
 
 class PacketConfig:
@@ -126,20 +252,46 @@ class PacketConfig:
 
 
 class Demodulator:
+    # The whole chain runs in single precision: RTL-SDR samples are 8-bit, and
+    # complex64 halves memory traffic relative to complex128.
     def __init__(self, cfg: PacketConfig) -> None:
         self.cfg = cfg
-        self.raw_samples = np.zeros(self.cfg.buffer_length, dtype=np.complex128)
-        self.iq = np.zeros(self.cfg.block_size + 9, dtype=np.complex128)
-        self.filtered = np.zeros(self.cfg.block_size + 1, dtype=np.complex128)
-        self.discriminated = np.zeros(self.cfg.block_size * 2, dtype=np.float64)
+        self.iq = np.zeros(self.cfg.block_size + 9, dtype=np.complex64)
+        self.filtered = np.zeros(self.cfg.block_size + 1, dtype=np.complex64)
+        self.discriminated = np.zeros(self.cfg.block_size * 2, dtype=np.float32)
         self.quantized = np.zeros(self.cfg.buffer_length, dtype=np.uint8)
         self.pkt = np.zeros((self.cfg.packet_symbols + 7) // 8, dtype=np.uint8)
+        # Every preamble-length run of symbol-spaced bits in quantized, one row per
+        # start index. A view, valid for the demodulator's lifetime because
+        # quantized is only ever updated in place.
+        self._preamble_windows = sliding_window_view(
+            self.quantized, (self.cfg.preamble_bytes.size - 1) * self.cfg.symbol_length + 1
+        )[:, :: self.cfg.symbol_length]
+        # Offset of each packet symbol's bit from the start of the packet in quantized
+        self._bit_offsets = np.arange(self.cfg.packet_symbols) * self.cfg.symbol_length
+        # Working space for discriminate(), allocated once instead of per block
+        self._discriminate_scratch = np.empty((2, self.cfg.block_size), dtype=np.float32)
         self.byte_to_cmplx = ByteToCmplxLUT()
 
     def demodulate(self, input_data: np.ndarray) -> List[Packet]:
-        self.raw_samples = np.roll(self.raw_samples, -self.cfg.block_size)
-
-        dest = self.raw_samples[self.cfg.buffer_length - self.cfg.block_size :]
+        # Called for every block; bind the config values once instead of re-resolving
+        # self.cfg.<attr> a dozen times per call.
+        block_size = self.cfg.block_size
+        tail = self.cfg.buffer_length - block_size
+
+        # Slide each buffer's history left in place: a single overlapping copy of
+        # the part that is kept, where np.roll allocated and copied the whole array.
+        iq = self.iq
+        filtered = self.filtered
+        discriminated = self.discriminated
+        quantized = self.quantized
+        iq[:-block_size] = iq[block_size:]
+        filtered[:-block_size] = filtered[block_size:]
+        discriminated[:-block_size] = discriminated[block_size:]
+        quantized[:-block_size] = quantized[block_size:]
+
+        # New samples land directly behind the filter history in iq
+        dest = iq[9:]
 
         if np.iscomplexobj(input_data):
             if input_data.size != dest.size:
@@ -148,43 +300,63 @@ class Demodulator:
                 )
                 raise ValueError("Incompatible array sizes")
             dest[:] = input_data
+        elif HAS_NUMBA:
+            # Raw bytes: convert, rotate, filter and discriminate in a single kernel
+            if input_data.size != dest.size * 2:
+                logger.error(
+                    f"Incompatible array sizes: in_bytes.size={input_data.size}, out_cmplx.size={dest.size}"
+                )
+                raise ValueError("Incompatible array sizes")
+            _demod_bytes_core(
+                input_data,
+                self.byte_to_cmplx.lut,
+                iq,
+                filtered,
+                discriminated[block_size:],
+                quantized[tail:],
+                FIR9_COEFFS,
+            )
+            return self._slice(self._search())
         else:
             self.byte_to_cmplx.execute(input_data, dest)
 
-        self.iq = np.roll(self.iq, -self.cfg.block_size)
-        self.filtered = np.roll(self.filtered, -self.cfg.block_size)
-        self.discriminated = np.roll(self.discriminated, -self.cfg.block_size)
-        self.quantized = np.roll(self.quantized, -self.cfg.block_size)
-
-        self.iq[9:] = self.raw_samples[self.cfg.buffer_length - self.cfg.block_size :]
-        rotate_fs4(self.iq[9:], self.iq[9:])
-        fir9(self.iq, self.filtered[1:])
-        discriminate(self.filtered, self.discriminated[self.cfg.block_size :])
-        quantize(
-            self.discriminated[self.cfg.block_size :],
-            self.quantized[self.cfg.buffer_length - self.cfg.block_size :],
-        )
+        if HAS_NUMBA:
+            _demod_core(
+                iq,
+                filtered,
+                discriminated[block_size:],
+                quantized[tail:],
+                FIR9_COEFFS,
+            )
+        else:
+            rotate_fs4(iq[9:], iq[9:])
+            fir9(iq, filtered[1:])
+            discriminate(filtered, discriminated[block_size:], self._discriminate_scratch)
+            quantize(discriminated[block_size:], quantized[tail:])
 
         indices = self._search()
         return self._slice(indices)
 
     def _search(self) -> List[int]:
-        indices = []
-        preamble_str = self.cfg.preamble_str
-
-        for offset in range(self.cfg.symbol_length):
-            view = self.quantized[offset :: self.cfg.symbol_length]
-            view_str = view.tobytes()
-
-            start = 0
-            while True:
-                idx = view_str.find(preamble_str, start)
-                if idx == -1:
-                    break
-                logger.debug(f"Preamble found at index {idx} (offset {offset})")
-                indices.append(idx * self.cfg.symbol_length + offset)
-                start = idx + 1
-
+        """
+        Start indices in quantized of every exact preamble match, grouped by
+        symbol phase (index % symbol_length) and ascending within each phase.
+        """
+        symbol_length = self.cfg.symbol_length
+        matches = np.flatnonzero(
+            (self._preamble_windows == self.cfg.preamble_bytes).all(axis=1)
+        )
+        # _slice keeps the first of duplicate packets, so keep the phase-major order
+        matches = matches[np.argsort(matches % symbol_length, kind="stable")]
+
+        indices = matches.tolist()
+        if logger.isEnabledFor(logging.DEBUG):
+            for idx in indices:
+                logger.debug(
+                    "Preamble found at index %d (offset %d)",
+                    idx // symbol_length,
+                    idx % symbol_length,
+                )
         return indices
 
     def _slice(self, indices: List[int]) -> List[Packet]:
@@ -194,29 +366,22 @@ class Demodulator:
             if q_idx > self.cfg.block_size:
                 continue
 
-            pkt = bytearray((self.cfg.packet_symbols + 7) // 8)
-            for i in range(self.cfg.packet_symbols):
-                pkt[i >> 3] <<= 1
-                pkt[i >> 3] |= self.quantized[q_idx + (i * self.cfg.symbol_length)]
-
-            pkt_bytes = bytes(pkt)
+            # One gather of the packet's symbol bits, packed MSB first
+            pkt_bytes = np.packbits(self.quantized[q_idx + self._bit_offsets]).tobytes()
             if pkt_bytes not in seen:
-                logger.debug(f"Sliced packet: {pkt_bytes.hex()}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Sliced packet: {pkt_bytes.hex()}")
                 seen.add(pkt_bytes)
 
                 # Calculate RSSI and SNR
                 signal_start = q_idx
-                signal_end = q_idx + self.cfg.packet_length
-
-                # Use filtered IQ data for power calculations
-                signal_iq = self.filtered[signal_start:signal_end]
 
                 # Estimate noise power from a region before the preamble
                 noise_start = max(0, signal_start - self.cfg.preamble_length)
                 noise_end = signal_start
                 if noise_end > noise_start:
                     noise_iq = self.filtered[noise_start:noise_end]
-                    noise_power = np.mean(np.abs(noise_iq) ** 2)
+                    noise_power = _mean_power(noise_iq)
                 else:
                     noise_power = (
                         1e-9  # Avoid division by zero if no noise region is available
@@ -226,7 +391,7 @@ class Demodulator:
                 preamble_iq = self.filtered[
                     signal_start : signal_start + self.cfg.preamble_length
                 ]
-                signal_power = np.mean(np.abs(preamble_iq) ** 2)
+                signal_power = _mean_power(preamble_iq)
 
                 rssi = 10 * math.log10(signal_power) if signal_power > 0 else -120
                 snr = (
@@ -246,7 +411,6 @@ class Demodulator:
         return packets
 
     def reset(self) -> None:
-        self.raw_samples.fill(0)
         self.iq.fill(0)
         self.filtered.fill(0)
         self.discriminated.fill(0)
@@ -1,67 +1,99 @@
 import asyncio
-import time
 import logging
+from typing import Optional
 
 class Hopper:
     def __init__(self, parser, set_freq_callback):
         self.p = parser
         self.set_freq_callback = set_freq_callback
         self.logger = logging.getLogger("rtldavis.hopper")
-        self.packet_received_event = asyncio.Event()
         self.MAX_MISSED = 50
+        # Delay after a packet before hopping, so SDR workers can finish decoding their buffers
+        self.SETTLE_DELAY = 0.5
+        # How long past the expected packet time to keep listening before hopping anyway
+        self.LATE_GRACE = 0.3
+        # Set by trigger(); consumed by the next _wait_for_packet() (same semantics as asyncio.Event)
+        self._packet_pending = False
+        self._waiter: Optional[asyncio.Future] = None
+
+    def _wake(self, received: bool) -> None:
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(received)
+
+    async def _wait_for_packet(self, deadline: Optional[float] = None) -> bool:
+        """
+        Waits until trigger() is called or the event loop clock reaches deadline.
+        Returns True if a packet arrived, False if the deadline passed first.
+
+        The deadline is a single loop.call_at() on the monotonic loop clock, so
+        there is no wait_for() task or TimeoutError per dwell, and NTP steps of
+        the wall clock cannot skew the hop schedule.
+        """
+        if not self._packet_pending:
+            loop = asyncio.get_running_loop()
+            self._waiter = loop.create_future()
+            handle = loop.call_at(deadline, self._wake, False) if deadline is not None else None
+            try:
+                if not await self._waiter:
+                    return False
+            finally:
+                self._waiter = None
+                if handle is not None:
+                    handle.cancel()
+        self._packet_pending = False
+        return True
 
     async def run(self):
         """
         Main hop sequence loop. Must be run as an asyncio task.
         """
+        loop = asyncio.get_running_loop()
         while True:
             # Wait for first sync packet
-            await self.packet_received_event.wait()
-            self.packet_received_event.clear()
+            await self._wait_for_packet()
             self.logger.info("Synced! Starting hop sequence.")
 
-            # Wait 500ms before hopping so any SDR workers have time to finish decoding their buffers
-            await asyncio.sleep(0.5)
+            await asyncio.sleep(self.SETTLE_DELAY)
 
             new_hop = self.p.next_hop()
             self.set_freq_callback(new_hop)
 
-            last_hop_time = time.time()
+            last_hop_time = loop.time()
             missed_count = 0
+            # Fixed for the whole synced run; read once rather than every dwell
+            dwell_time = self.p.dwell_time
+            late_grace = self.LATE_GRACE
 
             while True:
-                target_next_hop_time = last_hop_time + self.p.dwell_time
-                timeout = max(0, (target_next_hop_time + 0.3) - time.time())
-
-                try:
-                    await asyncio.wait_for(
-                        self.packet_received_event.wait(), timeout=timeout
-                    )
-                    self.packet_received_event.clear()
+                target_next_hop_time = last_hop_time + dwell_time
 
-                    actual_time = time.time()
+                if await self._wait_for_packet(target_next_hop_time + late_grace):
+                    actual_time = loop.time()
                     drift = actual_time - target_next_hop_time
 
                     if drift < -0.5:
                         self.logger.warning(
-                            f"Packet received too early ({actual_time - last_hop_time:.4f}s). Ignoring as duplicate/glitch."
+                            "Packet received too early (%.4fs). Ignoring as duplicate/glitch.",
+                            actual_time - last_hop_time,
                         )
                         continue
 
                     self.logger.info(
-                        f"Packet received. Expected: {target_next_hop_time:.4f}, Actual: {actual_time:.4f}, Drift: {drift:+.4f} s"
+                        "Packet received. Expected: %.4f, Actual: %.4f, Drift: %+.4f s",
+                        target_next_hop_time,
+                        actual_time,
+                        drift,
                     )
 
                     last_hop_time = actual_time
                     missed_count = 0
 
-                    # Wait 500ms before hopping so SDR workers can finish decoding their buffers
-                    await asyncio.sleep(0.5)
+                    await asyncio.sleep(self.SETTLE_DELAY)
 
-                except asyncio.TimeoutError:
+                else:
                     missed_count += 1
                     self.logger.warning(
-                        f"Missed packet {missed_count}/{self.MAX_MISSED}, hopping anyway."
+                        "Missed packet %d/%d, hopping anyway.", missed_count, self.MAX_MISSED
                     )
 
                     if missed_count >= self.MAX_MISSED:
@@ -82,4 +114,5 @@ class Hopper:
         """
         Signals that a packet was received, triggering the hopper to advance.
         """
-        self.packet_received_event.set()
+        self._packet_pending = True
+        self._wake(True)
@@ -34,7 +34,7 @@ def setup_integrations(args, sensor_store, mqtt_publisher):
             if mqtt_publisher:
                 mqtt_publisher.publish(msg)
             if ws_server:
-                asyncio.create_task(ws_server.broadcast("sensor", msg.sensor_values))
+                ws_server.broadcast_nowait("sensor", msg.sensor_values)
         
         bme280_task_handle = start_bme280_task(
             bus_num=args.bme280_i2c_bus,
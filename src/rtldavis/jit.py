@@ -0,0 +1,25 @@
+"""
+Optional Numba acceleration for the numeric hot paths.
+
+numba is the optional ``jit`` extra. Without it, ``HAS_NUMBA`` is False and
+callers keep using their NumPy implementations; ``njit`` then returns the
+undecorated Python function so kernels stay importable (and testable).
+"""
+from typing import Any, Callable
+
+try:
+    import numba
+
+    HAS_NUMBA = True
+except ImportError:
+    numba = None
+    HAS_NUMBA = False
+
+
+def njit(*args: Any, **kwargs: Any) -> Callable:
+    """``numba.njit`` when available, otherwise a no-op decorator."""
+    if HAS_NUMBA:
+        return numba.njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
@@ -3,8 +3,16 @@ import json
 import math
 import time
 import asyncio
+from collections import deque
 from paho.mqtt import client as mqtt_client
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from .version import __version__
 from .protocol import Message
@@ -28,6 +36,21 @@ _LAST_VALUE_KEYS = {
 # south) instead of 0 (due north), so it needs a circular mean instead.
 _CIRCULAR_KEYS = {"wind_direction"}
 
+# State publishes waiting for the background sender. When the broker is slow the
+# oldest of them is dropped rather than letting the backlog (or the caller) grow
+# unbounded. Retained discovery configs and availability messages are sent once per
+# station (one config per sensor plus a single "online") and never dropped, so they
+# do not count against this limit. Each station adds one state publish per
+# push_interval, so even all eight station ids leave room for a long broker stall.
+OUTBOX_SIZE = 256
+
+
+def _dumps(payload: Dict[str, Any]) -> Union[bytes, str]:
+    """Serializes an MQTT payload; orjson (optional) emits bytes paho can send as-is."""
+    if HAS_ORJSON:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload)
+
 
 def _circular_mean_deg(values: List[float]) -> int:
     sin_sum = sum(math.sin(math.radians(v)) for v in values)
@@ -73,16 +96,25 @@ class MQTTPublisher:
         self.client.on_disconnect = self._on_disconnect
         self._configured_stations: Set[int] = set()
         self._availability_topics: Dict[int, str] = {}
+        self._state_topics: Dict[int, str] = {}
+        # Home Assistant "device" block per station, shared by all of its configs
+        self._device_dicts: Dict[int, Dict[str, Any]] = {}
         self._last_data_time: Optional[float] = None
         self._timer_task: Optional[asyncio.Task] = None
         self._flush_task: Optional[asyncio.Task] = None
+        self._publish_task: Optional[asyncio.Task] = None
+        self._outbox: Deque[Tuple[str, Union[bytes, str], bool]] = deque()
+        self._outbox_ready = asyncio.Event()
+        # Non-retained entries in _outbox, the only ones subject to OUTBOX_SIZE
+        self._queued_states = 0
         # station_id -> sensor_id -> samples accumulated since the last flush
         self._pending: Dict[int, Dict[str, List[Any]]] = {}
 
         self.sensor_configs: Dict[str, MQTTSensorConfig] = {}
 
         logger.debug("Discovering available sensors...")
-        for name, decoder_class in decoders.__dict__.items():
+        for name in decoders.__all__:
+            decoder_class = getattr(decoders, name)
             if (
                 isinstance(decoder_class, type)
                 and issubclass(decoder_class, AbstractSensor)
@@ -131,6 +163,16 @@ class MQTTPublisher:
             icon="mdi:weather-pouring",
         )
 
+        # Payload key per sensor, fixed once discovery is done; looked up on every flush
+        self._effective_ids: Dict[str, str] = {
+            sensor_id: f"diag_{sensor_id}" if cfg.diagnostic else sensor_id
+            for sensor_id, cfg in self.sensor_configs.items()
+        }
+        self._value_templates: Dict[str, str] = {
+            sensor_id: f"{{% if '{effective_id}' in value_json %}}{{{{ value_json.{effective_id} }}}}{{% endif %}}"
+            for sensor_id, effective_id in self._effective_ids.items()
+        }
+
     def connect(self) -> None:
         try:
             if self.username and self.password:
@@ -151,10 +193,16 @@ class MQTTPublisher:
             self._timer_task.cancel()
         if self._flush_task:
             self._flush_task.cancel()
+        if self._publish_task:
+            self._publish_task.cancel()
+        # Send whatever the cancelled sender had not picked up yet
+        self._publish_batch(self._take_outbox())
         for topic in self._availability_topics.values():
             self.client.publish(topic, payload="offline", retain=True)
-        self.client.loop_stop()
+        # Disconnect before stopping the network loop so paho writes out the
+        # queued publishes first
         self.client.disconnect()
+        self.client.loop_stop()
 
     def _on_connect(
         self, client: mqtt_client.Client, userdata: Any, flags: Dict[str, Any], rc: int
@@ -174,28 +222,16 @@ class MQTTPublisher:
         logger.info("Disconnected from MQTT Broker.")
 
     def _publish_config(self, station_id: int, config: MQTTSensorConfig) -> None:
-        device_id = f"rtldavis_{station_id}"
-        effective_id = f"diag_{config.id}" if config.diagnostic else config.id
-        unique_id = f"{device_id}_{effective_id}"
-
+        unique_id = f"rtldavis_{station_id}_{self._effective_ids[config.id]}"
         config_topic = f"{self.discovery_prefix}/sensor/{unique_id}/config"
-        state_topic = f"{self.state_prefix}/{station_id}/state"
-        availability_topic = f"{self.state_prefix}/{station_id}/status"
-        self._availability_topics[station_id] = availability_topic
 
         payload = {
             "name": f"Davis {config.name}",
             "unique_id": unique_id,
-            "state_topic": state_topic,
-            "value_template": f"{{% if '{effective_id}' in value_json %}}{{{{ value_json.{effective_id} }}}}{{% endif %}}",
-            "device": {
-                "identifiers": [device_id],
-                "name": f"Davis Weather Station {station_id}",
-                "model": "RTL-SDR Davis Station",
-                "manufacturer": "rtldavis",
-                "sw_version": __version__,
-            },
-            "availability_topic": availability_topic,
+            "state_topic": self._state_topics[station_id],
+            "value_template": self._value_templates[config.id],
+            "device": self._device_dicts[station_id],
+            "availability_topic": self._availability_topics[station_id],
             "payload_available": "online",
             "payload_not_available": "offline",
         }
@@ -211,8 +247,57 @@ class MQTTPublisher:
             payload["entity_category"] = "diagnostic"
 
         logger.info(f"Publishing config for {config.id} to {config_topic}")
-        self.client.publish(config_topic, json.dumps(payload), retain=True)
-        self.client.publish(availability_topic, payload="online", retain=True)
+        self._enqueue(config_topic, _dumps(payload), retain=True)
+
+    def _availability_topic(self, station_id: int) -> str:
+        return f"{self.state_prefix}/{station_id}/status"
+
+    def _enqueue(self, topic: str, payload: Union[bytes, str], retain: bool = False) -> None:
+        """Hands a publish to _publish_loop so the event loop never waits on paho."""
+        if not retain:
+            # At the limit, the new publish replaces the oldest queued state publish
+            if self._queued_states < OUTBOX_SIZE or not self._drop_oldest_state():
+                self._queued_states += 1
+        self._outbox.append((topic, payload, retain))
+        self._outbox_ready.set()
+
+    def _drop_oldest_state(self) -> bool:
+        """Evicts the oldest non-retained publish; retained entries must still go out."""
+        for i, entry in enumerate(self._outbox):
+            if not entry[2]:
+                del self._outbox[i]
+                logger.warning("MQTT outbox full, dropping oldest publish to '%s'", entry[0])
+                return True
+        return False
+
+    def _take_outbox(self) -> List[Tuple[str, Union[bytes, str], bool]]:
+        batch = list(self._outbox)
+        self._outbox.clear()
+        self._queued_states = 0
+        return batch
+
+    def _publish_batch(self, batch: List[Tuple[str, Union[bytes, str], bool]]) -> None:
+        for topic, payload, retain in batch:
+            try:
+                result = self.client.publish(topic, payload, retain=retain)
+            except Exception as e:
+                logger.error(f"Failed to publish to topic '{topic}': {e}")
+                continue
+
+            status = result[0]
+            if status != 0:
+                logger.warning(
+                    f"Failed to send message to topic '{topic}', status: {status}"
+                )
+
+    async def _publish_loop(self) -> None:
+        while True:
+            # Drain everything queued so far (e.g. a new station's discovery burst
+            # plus its first state) and send it back-to-back from one worker
+            # thread hop instead of one to_thread() round-trip per message.
+            await self._outbox_ready.wait()
+            self._outbox_ready.clear()
+            await asyncio.to_thread(self._publish_batch, self._take_outbox())
 
     async def _timer_loop(self, station_id: int) -> None:
         """Samples time-since-last-data every second; the flush loop decides when
@@ -220,7 +305,7 @@ class MQTTPublisher:
         while True:
             await asyncio.sleep(1)
             if self._last_data_time:
-                seconds_since = int(time.time() - self._last_data_time)
+                seconds_since = int(time.monotonic() - self._last_data_time)
                 self._buffer(station_id, "seconds_since_last_data", seconds_since)
 
     async def _flush_loop(self) -> None:
@@ -230,7 +315,22 @@ class MQTTPublisher:
                 self._flush(station_id)
 
     def _buffer(self, station_id: int, sensor_id: str, value: Any) -> None:
-        self._pending.setdefault(station_id, {}).setdefault(sensor_id, []).append(value)
+        self._buffer_values(station_id, {sensor_id: value})
+
+    def _buffer_values(self, station_id: int, values: Dict[str, Any]) -> None:
+        # Look keys up before inserting: setdefault(k, {}) / setdefault(k, []) would
+        # build a throwaway dict and list for every value even once the keys exist.
+        pending = self._pending.get(station_id)
+        if pending is None:
+            pending = self._pending[station_id] = {}
+        for sensor_id, value in values.items():
+            if value is None:
+                continue
+            samples = pending.get(sensor_id)
+            if samples is None:
+                pending[sensor_id] = [value]
+            else:
+                samples.append(value)
 
     def _flush(self, station_id: int) -> None:
         pending = self._pending.pop(station_id, None)
@@ -238,44 +338,54 @@ class MQTTPublisher:
             return
 
         payload = {"id": station_id}
+        effective_ids = self._effective_ids
         for sensor_id, values in pending.items():
-            cfg = self.sensor_configs.get(sensor_id)
-            effective_id = f"diag_{sensor_id}" if (cfg and cfg.diagnostic) else sensor_id
-            payload[effective_id] = _aggregate(sensor_id, values)
-
-        state_topic = f"{self.state_prefix}/{station_id}/state"
-        json_payload = json.dumps(payload)
+            payload[effective_ids.get(sensor_id, sensor_id)] = _aggregate(sensor_id, values)
 
-        logger.info(f"Publishing aggregated message to topic '{state_topic}': {json_payload}")
-        result = self.client.publish(state_topic, json_payload, retain=False)
+        state_topic = self._state_topics[station_id]
 
-        status = result[0]
-        if status != 0:
-            logger.warning(
-                f"Failed to send message to topic '{state_topic}', status: {status}"
+        data = _dumps(payload)
+        if logger.isEnabledFor(logging.INFO):
+            # Log the JSON actually sent; orjson hands back bytes
+            logger.info(
+                "Publishing aggregated message to topic '%s': %s",
+                state_topic,
+                data.decode() if isinstance(data, bytes) else data,
             )
+        self._enqueue(state_topic, data, retain=False)
 
     def publish(self, msg: Message) -> None:
         station_id = msg.id
-        self._last_data_time = time.time()
+        self._last_data_time = time.monotonic()
         if self._timer_task is None:
             self._timer_task = asyncio.create_task(self._timer_loop(station_id))
         if self._flush_task is None:
             self._flush_task = asyncio.create_task(self._flush_loop())
+        if self._publish_task is None:
+            self._publish_task = asyncio.create_task(self._publish_loop())
 
         is_new_station = station_id not in self._configured_stations
         if is_new_station:
             logger.info(
                 f"New station ID {station_id} detected. Publishing sensor configurations."
             )
+            self._state_topics[station_id] = f"{self.state_prefix}/{station_id}/state"
+            availability_topic = self._availability_topic(station_id)
+            self._availability_topics[station_id] = availability_topic
+            self._device_dicts[station_id] = {
+                "identifiers": [f"rtldavis_{station_id}"],
+                "name": f"Davis Weather Station {station_id}",
+                "model": "RTL-SDR Davis Station",
+                "manufacturer": "rtldavis",
+                "sw_version": __version__,
+            }
             for config in self.sensor_configs.values():
                 self._publish_config(station_id, config)
+            # Every config shares the station's availability topic: mark it online once
+            self._enqueue(availability_topic, "online", retain=True)
             self._configured_stations.add(station_id)
 
-        for sensor_id, value in msg.sensor_values.items():
-            if value is None:
-                continue
-            self._buffer(station_id, sensor_id, value)
+        self._buffer_values(station_id, msg.sensor_values)
 
         if is_new_station:
             # Publish the first reading immediately so entities don't sit
@@ -4,7 +4,7 @@ import random
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Optional, Type
+from typing import List, Dict, NamedTuple, Optional, Type
 
 import numpy as np
 
@@ -41,9 +41,25 @@ class SensorType(Enum):
     RAIN = 0xE
 
 
+# SensorType(value) goes through EnumMeta.__call__ and raises on unknown IDs; a
+# plain dict probe is several times cheaper for the once-per-message lookup.
+_SENSOR_TYPES: Dict[int, SensorType] = {t.value: t for t in SensorType}
+
+_DECODED_LOG_FMT = (
+    "Decoded message for station ID %d (sensor: %s):\n"
+    "  Raw data:      %s\n"
+    "  - Header:      %s (Sensor ID: %d, Station ID: %d)\n"
+    "  - Wind Speed:    %s (%d mph)\n"
+    "  - Wind Dir:      %s (%d)\n"
+    "  - Sensor data (%s): %s\n"
+)
+
+
 @dataclass
 class Message:
-    packet: dsp.Packet
+    # Kept for diagnostics, but left out of repr/eq: "Received: {msg}" logs would
+    # otherwise dump the raw packet's ndarray for every message.
+    packet: dsp.Packet = field(repr=False, compare=False)
     id: int
     sensor_type: Optional[SensorType]
     sensor_values: Dict[str, any] = field(default_factory=dict)
@@ -51,7 +67,7 @@ class Message:
     raw_msg_type3: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Hop:
     channel_idx: int
     channel_freq: int
@@ -59,8 +75,9 @@ class Hop:
     transmitter: int
 
 
-@dataclass(frozen=True)
-class DecoderKey:
+class DecoderKey(NamedTuple):
+    # Looked up for every decoded message: a tuple hashes and compares in C,
+    # where a frozen dataclass runs Python-level __init__/__hash__/__eq__.
     station_id: int
     sensor_type: SensorType
 
@@ -83,6 +100,10 @@ def swap_bit_order(b: int) -> int:
     return b
 
 
+# swap_bit_order() for every byte value, for use with bytes.translate()
+_SWAP_BIT_ORDER = bytes(swap_bit_order(b) for b in range(256))
+
+
 @dataclass
 class Parser:
     symbol_length: int
@@ -95,6 +116,8 @@ class Parser:
     channels: List[int] = field(init=False)
     channel_count: int = field(init=False)
     hop_pattern: List[int] = field(init=False)
+    # channels[hop_pattern[i]] for every hop index
+    hop_freqs: List[int] = field(init=False)
     hop_idx: int = 0
     transmitter: int = 0
     freq_corr: int = 0
@@ -111,6 +134,15 @@ class Parser:
     sensor_decoders: Dict[SensorType, Type[AbstractSensor]] = field(init=False)
     active_decoders: Dict[DecoderKey, AbstractSensor] = field(default_factory=dict)
 
+    # Trailing partial block from the last process_samples() call
+    _leftover: Optional[np.ndarray] = field(default=None, init=False, repr=False)
+
+    # Stateless decoders applied to every message, built once in __post_init__
+    _wind_speed: WindSpeedSensor = field(init=False, repr=False)
+    _wind_direction: WindDirectionSensor = field(init=False, repr=False)
+    _rssi: RSSISensor = field(init=False, repr=False)
+    _snr: SNRSensor = field(init=False, repr=False)
+
     def __post_init__(self):
         self.cfg = new_packet_config(self.symbol_length)
         self.demodulator = dsp.Demodulator(self.cfg)
@@ -223,8 +255,9 @@ class Parser:
             46,
             18,
         ]
+        self.hop_freqs = [self.channels[ch] for ch in self.hop_pattern]
         self.hop_idx = random.randint(0, self.channel_count - 1)
-        self.factor = (float(self.max_tr_ch_list / 2) + 0.5) * 2.0
+        self.factor = (self.max_tr_ch_list / 2 + 0.5) * 2.0
 
         self.sensor_decoders = {
             SensorType.TEMPERATURE: TemperatureSensor,
@@ -237,22 +270,33 @@ class Parser:
             SensorType.LIGHT: LightSensor,
             SensorType.WIND_GUST_SPEED: WindGustSensor,
         }
+        self._wind_speed = WindSpeedSensor(logger)
+        self._wind_direction = WindDirectionSensor(logger)
+        self._rssi = RSSISensor(logger)
+        self._snr = SNRSensor(logger)
 
     def _get_decoder(self, station_id: int, sensor_type: SensorType) -> AbstractSensor:
+        """
+        Returns the decoder instance for one station's sensor, creating it on first
+        use. Stateful decoders (rain totals) therefore never mix counts between
+        stations sharing a process.
+        """
         key = DecoderKey(station_id, sensor_type)
-        if key not in self.active_decoders:
+        decoder = self.active_decoders.get(key)
+        if decoder is None:
             if sensor_type not in self.sensor_decoders:
                 raise ValueError(
                     f"No decoder class registered for sensor type {sensor_type.name}"
                 )
             decoder_class = self.sensor_decoders[sensor_type]
-            self.active_decoders[key] = decoder_class(logger)
-        return self.active_decoders[key]
+            decoder = self.active_decoders[key] = decoder_class(logger)
+        return decoder
 
     def _hop(self) -> Hop:
-        channel_idx = self.hop_pattern[self.hop_idx]
-        channel_freq = self.channels[channel_idx]
-        return Hop(channel_idx, channel_freq, self.freq_corr, self.transmitter)
+        hop_idx = self.hop_idx
+        return Hop(
+            self.hop_pattern[hop_idx], self.hop_freqs[hop_idx], self.freq_corr, self.transmitter
+        )
 
     def set_hop(self, n: int, tr: int) -> Hop:
         self.hop_idx = n % self.channel_count
@@ -266,9 +310,7 @@ class Parser:
             new_freq_corr += error * (i + 1)
             ptr = (ptr + 1) % self.max_tr_ch_list
 
-        self.freq_corr = int(
-            float(new_freq_corr) / (self.factor * self.max_tr_ch_list / 2.0)
-        )
+        self.freq_corr = int(new_freq_corr / (self.factor * self.max_tr_ch_list / 2.0))
         return self._hop()
 
     def next_hop(self) -> Hop:
@@ -279,27 +321,81 @@ class Parser:
         self.hop_idx = random.randint(0, self.channel_count - 1)
         return self.set_hop(self.hop_idx, self.transmitter)
 
+    def process_samples(self, samples: np.ndarray) -> List[Message]:
+        """
+        Demodulates and parses a buffer holding one or more whole blocks.
+
+        Blocks still go through the demodulator one at a time, since its history
+        buffers carry across block boundaries and parse() reads the discriminator
+        output of the block just demodulated. Accepting a whole multi-block read
+        lets the caller hand over samples with one queue round-trip instead of one
+        per block.
+
+        Reads need not be a multiple of the block size: a trailing partial block
+        is kept and prepended to the next call's samples, so the stream stays
+        continuous whatever size the SDR hands over.
+        """
+        leftover = self._leftover
+        if leftover is not None and np.iscomplexobj(leftover) != np.iscomplexobj(samples):
+            # Raw bytes on one side of the boundary and complex samples on the
+            # other: bring the raw side through the demodulator's own lookup table,
+            # which yields exactly the samples demodulating it raw would have.
+            if np.iscomplexobj(leftover):
+                samples = self._bytes_to_complex(samples)
+            else:
+                leftover = self._bytes_to_complex(leftover)
+
+        block_len = self.cfg.block_size if np.iscomplexobj(samples) else self.cfg.block_size2
+        if leftover is None:
+            if samples.size == block_len:
+                # The usual case: the SDR delivers exactly one block per transfer
+                return self.parse(self.demodulator.demodulate(samples))
+        else:
+            samples = np.concatenate((leftover, samples))
+
+        n_blocks = samples.size // block_len
+        used = n_blocks * block_len
+        self._leftover = samples[used:].copy() if used < samples.size else None
+
+        demodulate = self.demodulator.demodulate
+        msgs: List[Message] = []
+        for block in samples[:used].reshape(n_blocks, block_len):
+            msgs.extend(self.parse(demodulate(block)))
+        return msgs
+
+    def _bytes_to_complex(self, raw: np.ndarray) -> np.ndarray:
+        """Converts interleaved uint8 I/Q to complex64 samples."""
+        out = np.empty(raw.size // 2, dtype=np.complex64)
+        if raw.size % 2:
+            # Half an I/Q pair has no complex equivalent
+            logger.debug("Dropping a trailing half I/Q sample at a sample format change")
+        self.demodulator.byte_to_cmplx.execute(raw[: out.size * 2], out)
+        return out
+
     def parse(self, pkts: List[dsp.Packet]) -> List[Message]:
         seen: Set[bytes] = set()
         msgs: List[Message] = []
         for pkt in pkts:
+            # One copy out of the packet's ndarray, shared by the log and the decode
+            raw = bytes(pkt.data)
             if self.include_crc_failed:
-                raw_hex = " ".join([f"{b:02x}" for b in pkt.data])
-                logger.warning(f"RAW DEMOD OUTPUT: {raw_hex} (RSSI: {pkt.rssi:.1f})")
+                logger.warning("RAW DEMOD OUTPUT: %s (RSSI: %.1f)", raw.hex(" "), pkt.rssi)
 
-            data = bytes(swap_bit_order(b) for b in pkt.data)
-            data_hex = " ".join([f"{b:02x}" for b in data])
+            data = raw.translate(_SWAP_BIT_ORDER)
 
             if data in seen:
                 continue
             seen.add(data)
 
-            if self._crc.checksum(data[2:]) != 0:
+            # Payload after the sync word, sliced once and shared by the CRC check
+            # and every decoder
+            msg_data = data[2:]
+            if self._crc.checksum(msg_data) != 0:
                 if self.include_crc_failed:
-                    logger.warning(f"CRC FAILED on: {data_hex}")
+                    logger.warning(f"CRC FAILED on: {data.hex(' ')}")
                 continue
 
-            logger.info(f"CRC check OK. RSSI: {pkt.rssi:.2f} dB, SNR: {pkt.snr:.2f} dB")
+            logger.info("CRC check OK. RSSI: %.2f dB, SNR: %.2f dB", pkt.rssi, pkt.snr)
 
             if pkt.index >= 0:
                 preamble_start = pkt.index
@@ -313,9 +409,8 @@ class Parser:
                 # CC1101 path: demodulation is in hardware; no discriminated buffer.
                 freq_err = 0
                 
-            logger.info(f"Frequency error: {freq_err} Hz")
+            logger.info("Frequency error: %d Hz", freq_err)
 
-            msg_data = data[2:]
             msg_id = msg_data[0] & 0x7
 
             tr = msg_id
@@ -326,9 +421,10 @@ class Parser:
             self.transmitter = tr
 
             if self.station_id is not None and msg_id != self.station_id:
-                logger.info(
-                    f"Ignoring message for station ID {msg_id}, Raw data: {msg_data.hex()}"
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        f"Ignoring message for station ID {msg_id}, Raw data: {msg_data.hex()}"
+                    )
                 continue
 
             msg = self._parse_sensor_data(pkt, msg_id, msg_data)
@@ -340,31 +436,40 @@ class Parser:
         self, pkt: dsp.Packet, msg_id: int, msg_data: bytes
     ) -> Optional[Message]:
         sensor_id = msg_data[0] >> 4
-        sensor_type = None
-        try:
-            sensor_type = SensorType(sensor_id)
-        except ValueError:
+        sensor_type = _SENSOR_TYPES.get(sensor_id)
+        if sensor_type is None:
             logger.warning(
                 f"Unknown sensor type: 0x{sensor_id:02X}. Raw data: {msg_data.hex()}"
             )
             # We still want to return a message below so the Hopper knows we received a valid packet!
 
-        raw_hex = msg_data.hex()
-        log_msg = f"Decoded message for station ID {msg_id} (sensor: {sensor_type.name if sensor_type else 'Unknown'}):\n"
-        log_msg += f"  Raw data:      {raw_hex}\n"
-        log_msg += f"  - Header:      {raw_hex[0:2]} (Sensor ID: {sensor_id}, Station ID: {msg_id})\n"
-        log_msg += f"  - Wind Speed:    {raw_hex[2:4]} ({msg_data[1]} mph)\n"
-        log_msg += f"  - Wind Dir:      {raw_hex[4:6]} ({msg_data[2]})\n"
-        log_msg += f"  - Sensor data ({sensor_type.name if sensor_type else 'Unknown'}): {raw_hex[6:]}\n"
-        logger.info(log_msg)
-
-        sensor_values = {}
+        # The hex slices are only worth computing when INFO is actually on
+        if logger.isEnabledFor(logging.INFO):
+            raw_hex = msg_data.hex()
+            type_name = sensor_type.name if sensor_type else "Unknown"
+            logger.info(
+                _DECODED_LOG_FMT,
+                msg_id,
+                type_name,
+                raw_hex,
+                raw_hex[0:2],
+                sensor_id,
+                msg_id,
+                raw_hex[2:4],
+                msg_data[1],
+                raw_hex[4:6],
+                msg_data[2],
+                type_name,
+                raw_hex[6:],
+            )
 
         # Common values
-        sensor_values["wind_speed"] = WindSpeedSensor(logger).decode(msg_data)
-        sensor_values["wind_direction"] = WindDirectionSensor(logger).decode(msg_data)
-        sensor_values["rssi"] = RSSISensor(logger).decode(pkt.rssi)
-        sensor_values["snr"] = SNRSensor(logger).decode(pkt.snr)
+        sensor_values = {
+            "wind_speed": self._wind_speed.decode(msg_data),
+            "wind_direction": self._wind_direction.decode(msg_data),
+            "rssi": self._rssi.decode(pkt.rssi),
+            "snr": self._snr.decode(pkt.snr),
+        }
 
         if sensor_type in self.sensor_decoders:
             decoder = self._get_decoder(msg_id, sensor_type)
@@ -374,7 +479,7 @@ class Parser:
             else:
                 sensor_values[decoder.config.id] = value
         elif sensor_type is not None:
-            logger.warning(f"No decoder registered for sensor type {sensor_type.name}")
+            logger.warning("No decoder registered for sensor type %s", sensor_type.name)
 
         return Message(
             packet=pkt,
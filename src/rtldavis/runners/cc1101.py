@@ -36,7 +36,9 @@ async def run(args, log_level, sensor_store, mqtt_publisher):
         def set_freq(hop_obj):
             radio.set_frequency(hop_obj.channel_freq + args.cc1101_offset)
             logger.info(
-                f"Hopping to {hop_obj.channel_freq + args.cc1101_offset} Hz for transmitter {hop_obj.transmitter}"
+                "Hopping to %d Hz for transmitter %d",
+                hop_obj.channel_freq + args.cc1101_offset,
+                hop_obj.transmitter,
             )
 
         hopper = Hopper(p, set_freq)
@@ -47,12 +49,12 @@ async def run(args, log_level, sensor_store, mqtt_publisher):
         def _handle_messages(msgs):
             for msg in msgs:
                 hopper.trigger()
-                logger.info(f"Received: {msg}")
+                logger.info("Received: %s", msg)
                 sensor_store.update(msg)
                 if mqtt_publisher:
                     mqtt_publisher.publish(msg)
                 if ws_server:
-                    asyncio.create_task(ws_server.broadcast("sensor", msg.sensor_values))
+                    ws_server.broadcast_nowait("sensor", msg.sensor_values)
 
         # Poll the CC1101 RXFIFO.
         while True:
@@ -1,13 +1,13 @@
 import asyncio
 import logging
-import multiprocessing
-import queue
 
 from .. import protocol
-from ..worker import worker_main
+from ..worker import BLOCKS_PER_READ, add_result_reader, start_worker, stop_worker
 from ..cc1101 import CC1101
 from ..hopper import Hopper
+from ..sdr_reader import RawSampleReader, wait_until_ready
 from ..integrations import setup_integrations
+from ..scheduling import worker_cpus
 
 try:
     from rtlsdr import RtlSdrAio
@@ -22,14 +22,19 @@ async def run(args, log_level, devices, selected_device, sensor_store, mqtt_publ
     radio = CC1101(spi_bus=args.cc1101_spi_bus, spi_device=args.cc1101_spi_device)
     sdr = None
     worker_process = None
+    reader = None
+    result_fd = None
+    loop = asyncio.get_running_loop()
     tasks = []
+    # In-flight CC1101 state reads; the loop only keeps weak references to tasks
+    state_reads = set()
 
     try:
         radio.open()
         radio.configure_for_davis()
 
         sdr = RtlSdrAio(device_index=selected_device.index)
-        await asyncio.sleep(1)
+        await wait_until_ready(sdr)
 
         p = protocol.Parser(symbol_length=14, station_id=args.station_id, include_crc_failed=args.include_crc_failed)
         sdr.sample_rate = p.cfg.sample_rate
@@ -43,25 +48,35 @@ async def run(args, log_level, devices, selected_device, sensor_store, mqtt_publ
         else:
             hop = p.rand_hop()
             
-        sdr.center_freq = hop.channel_freq + hop.freq_corr
+        current_freq = hop.channel_freq + hop.freq_corr
+        sdr.center_freq = current_freq
         radio.set_frequency(hop.channel_freq + args.cc1101_offset)
         radio.start_rx()
 
         logger.warning(f"Dual Mode: RTLSDR tuned to {sdr.center_freq} Hz, CC1101 tuned to {hop.channel_freq + args.cc1101_offset} Hz - Waiting for sync...")
 
-        data_queue = multiprocessing.Queue()
-        result_queue = multiprocessing.Queue()
-        
-        worker_process = multiprocessing.Process(
-            target=worker_main,
-            args=(data_queue, result_queue, args.station_id, 14, log_level),
+        # Raw uint8 I/Q: two bytes per sample
+        read_bytes = p.cfg.block_size * BLOCKS_PER_READ * 2
+        worker_process, ring, result_queue = start_worker(
+            args.station_id,
+            14,
+            log_level,
+            read_bytes,
+            cpus=worker_cpus(args.cpu),
+            use_thread=args.dsp_thread,
+            parser=p,
+            include_crc_failed=args.include_crc_failed,
         )
-        worker_process.start()
 
         tasks, ws_server = setup_integrations(args, sensor_store, mqtt_publisher)
 
         def set_freq(hop_obj):
-            sdr.center_freq = hop_obj.channel_freq + hop_obj.freq_corr
+            nonlocal current_freq
+            freq = hop_obj.channel_freq + hop_obj.freq_corr
+            # Retuning is a blocking USB control transfer; skip it when the hop lands on the current frequency
+            if freq != current_freq:
+                sdr.center_freq = freq
+                current_freq = freq
             radio.set_frequency(hop_obj.channel_freq + args.cc1101_offset)
 
         hopper = Hopper(p, set_freq)
@@ -75,31 +90,41 @@ async def run(args, log_level, devices, selected_device, sensor_store, mqtt_publ
             if mqtt_publisher:
                 mqtt_publisher.publish(msg)
             if ws_server:
-                asyncio.create_task(ws_server.broadcast("sensor", msg.sensor_values))
+                ws_server.broadcast_nowait("sensor", msg.sensor_values)
 
-        async def result_queue_reader(q: multiprocessing.Queue):
-            while True:
-                try:
-                    msg = await asyncio.to_thread(q.get_nowait)
-                    if msg:
-                        logger.warning(f"[RTLSDR] Received: {msg}")
-                        state = await asyncio.to_thread(radio.debug_state)
-                        logger.debug(f"[CC1101] Hardware State at Sync: {state}")
-                        _handle_msg_unified(msg)
-                except queue.Empty:
-                    await asyncio.sleep(0.01)
+        async def log_cc1101_state():
+            state = await asyncio.to_thread(radio.debug_state)
+            logger.debug("[CC1101] Hardware State at Sync: %s", state)
 
-        result_reader_task = asyncio.create_task(result_queue_reader(result_queue))
-        tasks.append(result_reader_task)
+        def state_read_done(task):
+            state_reads.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(f"Failed to read CC1101 state: {task.exception()}")
+
+        def on_rtlsdr_results(msgs):
+            # Handled in the loop callback, so bursts stay in order
+            try:
+                for msg in msgs:
+                    logger.warning("[RTLSDR] Received: %s", msg)
+                    _handle_msg_unified(msg)
+            except Exception as e:
+                logger.error(f"Error handling RTLSDR results: {e}")
+            if logger.isEnabledFor(logging.DEBUG):
+                # The SPI register dump blocks; only that part leaves the loop
+                task = asyncio.create_task(log_cc1101_state())
+                state_reads.add(task)
+                task.add_done_callback(state_read_done)
+
+        result_fd = add_result_reader(loop, result_queue, on_rtlsdr_results)
 
         async def cc1101_poller():
             while True:
                 pkt = await asyncio.to_thread(radio.receive_packet)
                 if pkt is not None:
-                    logger.debug(f"[CC1101] Hardware Triggered! FIFO extracted: {pkt.data}")
+                    logger.debug("[CC1101] Hardware Triggered! FIFO extracted: %s", pkt.data)
                     msgs = p.parse([pkt])
                     for msg in msgs:
-                        logger.warning(f"[CC1101] Received: {msg}")
+                        logger.warning("[CC1101] Received: %s", msg)
                         _handle_msg_unified(msg)
                 else:
                     await asyncio.sleep(0.01)
@@ -107,9 +132,8 @@ async def run(args, log_level, devices, selected_device, sensor_store, mqtt_publ
         cc1101_task = asyncio.create_task(cc1101_poller())
         tasks.append(cc1101_task)
 
-        read_size = p.cfg.block_size
-        async for samples in sdr.stream(num_samples_or_bytes=read_size):
-            data_queue.put(samples)
+        reader = RawSampleReader(sdr, read_bytes, ring.put)
+        await reader.run()
 
     except asyncio.CancelledError:
         logger.info("Stopping...")
@@ -117,18 +141,16 @@ async def run(args, log_level, devices, selected_device, sensor_store, mqtt_publ
         logger.exception(f"An error occurred: {e}")
         return 1
     finally:
-        for t in tasks:
+        for t in [*tasks, *state_reads]:
             t.cancel()
+        if result_fd is not None:
+            loop.remove_reader(result_fd)
+        if reader:
+            # Stop feeding the worker before closing its ring
+            reader.stop()
         if worker_process:
-            data_queue.put(None)
-            worker_process.join(timeout=2)
-            if worker_process.is_alive():
-                worker_process.terminate()
+            stop_worker(worker_process, ring, timeout=2)
         if sdr:
-            try:
-                await sdr.stop()
-            except Exception:
-                pass
             sdr.close()
         radio.close()
 
@@ -1,12 +1,12 @@
 import asyncio
 import logging
-import multiprocessing
-import queue
 
 from .. import protocol
-from ..worker import worker_main
+from ..worker import BLOCKS_PER_READ, add_result_reader, start_worker, stop_worker
 from ..hopper import Hopper
+from ..sdr_reader import RawSampleReader
 from ..integrations import setup_integrations
+from ..scheduling import worker_cpus
 
 try:
     from rtlsdr import RtlSdrAio
@@ -20,6 +20,9 @@ async def run(args, log_level, devices, selected_device, sensor_store, mqtt_publ
 
     sdr = None
     worker_process = None
+    reader = None
+    result_fd = None
+    loop = asyncio.get_running_loop()
     try:
         logger.warning(f"Initializing RTL-SDR device with index {selected_device.index} (Serial: {selected_device.serial})...")
         sdr = RtlSdrAio(device_index=selected_device.index)
@@ -48,59 +51,68 @@ async def run(args, log_level, devices, selected_device, sensor_store, mqtt_publ
         else:
             hop = p.rand_hop()
             
-        sdr.center_freq = hop.channel_freq + hop.freq_corr
+        current_freq = hop.channel_freq + hop.freq_corr
+        sdr.center_freq = current_freq
         
         logger.info(f"SDR Initial State: Gain={sdr.get_gain()}, Sample Rate={sdr.get_sample_rate()}, Center Freq={sdr.get_center_freq()}, Freq Correction={sdr.get_freq_correction()}ppm")
 
         logger.warning(f"Tuned to {sdr.center_freq} Hz (US Band) - Waiting for sync...")
 
         # Set up multiprocessing
-        data_queue = multiprocessing.Queue()
-        result_queue = multiprocessing.Queue()
-        
-        worker_process = multiprocessing.Process(
-            target=worker_main,
-            args=(data_queue, result_queue, args.station_id, 14, log_level),
+        # Raw uint8 I/Q: two bytes per sample
+        read_bytes = p.cfg.block_size * BLOCKS_PER_READ * 2
+        worker_process, ring, result_queue = start_worker(
+            args.station_id,
+            14,
+            log_level,
+            read_bytes,
+            cpus=worker_cpus(args.cpu),
+            use_thread=args.dsp_thread,
+            parser=p,
+            include_crc_failed=args.include_crc_failed,
         )
-        worker_process.start()
 
         # Set up peripherals
         tasks, ws_server = setup_integrations(args, sensor_store, mqtt_publisher)
 
         # Set up Hopper
         def set_freq(hop_obj):
-            sdr.center_freq = hop_obj.channel_freq + hop_obj.freq_corr
-            logger.info(f"Hopping to {sdr.center_freq} Hz for transmitter {hop_obj.transmitter}")
+            nonlocal current_freq
+            freq = hop_obj.channel_freq + hop_obj.freq_corr
+            # Retuning is a blocking USB control transfer; skip it when the hop lands on the current frequency
+            if freq != current_freq:
+                sdr.center_freq = freq
+                current_freq = freq
+            logger.info("Hopping to %d Hz for transmitter %d", freq, hop_obj.transmitter)
 
         hopper = Hopper(p, set_freq)
         if not args.no_hop:
             hop_task_handle = asyncio.create_task(hopper.run())
             tasks.append(hop_task_handle)
 
-        async def result_queue_reader(q: multiprocessing.Queue):
-            while True:
-                try:
-                    msg = await asyncio.to_thread(q.get_nowait)
-                    if msg:
-                        hopper.trigger()
-                        logger.info(f"Received: {msg}")
-                        sensor_store.update(msg)
-                        if mqtt_publisher:
-                            mqtt_publisher.publish(msg)
-                        if ws_server:
-                            asyncio.create_task(ws_server.broadcast("sensor", msg.sensor_values))
-                except queue.Empty:
-                    await asyncio.sleep(0.01)
-                except Exception as e:
-                    logger.error(f"Error reading from result queue: {e}")
-
-        result_reader_task = asyncio.create_task(result_queue_reader(result_queue))
-        tasks.append(result_reader_task)
-
-        read_size = p.cfg.block_size
-        
-        async for samples in sdr.stream(num_samples_or_bytes=read_size):
-            data_queue.put(samples)
+        trigger = hopper.trigger
+        update_store = sensor_store.update
+        publish = mqtt_publisher.publish if mqtt_publisher else None
+
+        def on_results(msgs):
+            try:
+                # One packet burst advances the hop schedule once
+                trigger()
+                for msg in msgs:
+                    # Lazy: the Message repr is only built if INFO is on
+                    logger.info("Received: %s", msg)
+                    update_store(msg)
+                    if publish:
+                        publish(msg)
+                    if ws_server:
+                        ws_server.broadcast_nowait("sensor", msg.sensor_values)
+            except Exception as e:
+                logger.error(f"Error reading from result queue: {e}")
+
+        result_fd = add_result_reader(loop, result_queue, on_results)
+
+        reader = RawSampleReader(sdr, read_bytes, ring.put)
+        await reader.run()
 
     except asyncio.CancelledError:
         logger.info("Stopping...")
@@ -110,16 +122,14 @@ async def run(args, log_level, devices, selected_device, sensor_store, mqtt_publ
     finally:
         for t in tasks:
             t.cancel()
+        if result_fd is not None:
+            loop.remove_reader(result_fd)
+        if reader:
+            # Stop feeding the worker before closing its ring
+            reader.stop()
         if worker_process:
-            data_queue.put(None)  # Sentinel to stop worker
-            worker_process.join(timeout=5)
-            if worker_process.is_alive():
-                worker_process.terminate()
+            stop_worker(worker_process, ring, timeout=5)
         if sdr:
-            try:
-                await sdr.stop()
-            except Exception:
-                pass
             sdr.close()
 
     return 0
@@ -0,0 +1,114 @@
+"""
+Shared-memory ring buffer carrying raw I/Q reads from the SDR reader thread to
+the DSP worker process.
+"""
+import logging
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+from typing import Any, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_COUNTER_MASK = 0xFFFFFFFF
+
+
+class SampleRing:
+    """
+    Single-producer/single-consumer ring of fixed-size uint8 slots.
+
+    Unlike a multiprocessing.Queue, a read is never pickled or pushed through a
+    pipe: the producer copies it straight into a shared slot and the worker
+    demodulates it in place. The producer only ever advances ``head`` and the
+    consumer only ever advances ``tail``, so neither counter needs a lock; a
+    semaphore counting filled slots lets the worker block instead of spinning.
+
+    When the worker falls behind and every slot is full, new reads are dropped:
+    the producer cannot reclaim a slot the consumer may be reading.
+    """
+
+    def __init__(self, slot_bytes: int, slots: int) -> None:
+        # Slots are indexed by the free-running counters modulo slots, which only
+        # stays continuous across the 2**32 wraparound for a power of two
+        if slots <= 0 or slots & (slots - 1):
+            raise ValueError(f"slots must be a power of two, got {slots}")
+        self.slot_bytes = slot_bytes
+        self.slots = slots
+        self._shm = shared_memory.SharedMemory(create=True, size=slot_bytes * slots)
+        # head, tail: free-running uint32 counters (wrap-around safe via masking)
+        self._counters = multiprocessing.Array("I", 2, lock=False)
+        self._lengths = multiprocessing.Array("I", slots, lock=False)
+        self._filled = multiprocessing.Semaphore(0)
+        self._closed = multiprocessing.Event()
+        self._dropped = 0
+        self._attach()
+
+    def _attach(self) -> None:
+        self._slots = np.ndarray(
+            (self.slots, self.slot_bytes), dtype=np.uint8, buffer=self._shm.buf
+        )
+
+    def __getstate__(self) -> dict:
+        # Only reached with the spawn start method; the ndarray view is rebuilt
+        # over the re-attached segment on the other side.
+        state = self.__dict__.copy()
+        del state["_slots"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._attach()
+
+    def put(self, data: Any) -> bool:
+        """
+        Copies one read (any buffer of at most slot_bytes bytes) into the next free
+        slot. Returns False if the ring was full and the read was dropped.
+        """
+        head, tail = self._counters[0], self._counters[1]
+        if (head - tail) & _COUNTER_MASK >= self.slots:
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 100 == 0:
+                logger.warning(
+                    f"DSP worker is falling behind; dropped {self._dropped} sample reads"
+                )
+            return False
+
+        src = np.frombuffer(data, dtype=np.uint8)
+        slot = head % self.slots
+        self._slots[slot, : src.size] = src
+        self._lengths[slot] = src.size
+        self._counters[0] = (head + 1) & _COUNTER_MASK
+        self._filled.release()
+        return True
+
+    def get(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        Returns a view of the oldest unread slot, or None once the ring is closed
+        and drained. Raises queue.Empty on timeout. The view stays valid until
+        release() is called.
+        """
+        if not self._filled.acquire(timeout=timeout):
+            if self._closed.is_set():
+                return None
+            raise queue.Empty
+        if self._closed.is_set() and self._counters[0] == self._counters[1]:
+            return None
+        slot = self._counters[1] % self.slots
+        return self._slots[slot, : self._lengths[slot]]
+
+    def release(self) -> None:
+        """Hands the slot returned by the last get() back to the producer."""
+        self._counters[1] = (self._counters[1] + 1) & _COUNTER_MASK
+
+    def close(self) -> None:
+        """Tells the consumer to stop once it has drained the ring."""
+        self._closed.set()
+        self._filled.release()
+
+    def unlink(self) -> None:
+        """Frees the shared memory segment. Call from the producer after the worker exits."""
+        del self._slots
+        self._shm.close()
+        self._shm.unlink()
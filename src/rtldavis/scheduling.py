@@ -0,0 +1,52 @@
+"""
+Optional CPU pinning and real-time priority (Linux only).
+
+Hop timing is sensitive to the event loop being migrated between cores or
+preempted by other processes. Both knobs are opt-in from the command line and
+degrade to a warning where the platform or missing privileges (CAP_SYS_NICE)
+don't allow them.
+"""
+import logging
+import os
+from typing import Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+def pin_to_cpus(cpus: Set[int]) -> bool:
+    """Restricts the calling process to the given cores."""
+    try:
+        os.sched_setaffinity(0, cpus)
+    except (AttributeError, OSError) as e:
+        logger.warning(f"Could not pin process {os.getpid()} to CPU(s) {sorted(cpus)}: {e}")
+        return False
+    logger.info(f"Pinned process {os.getpid()} to CPU(s) {sorted(cpus)}")
+    return True
+
+
+def set_realtime_priority(priority: int) -> bool:
+    """
+    Switches the calling process to SCHED_FIFO at the given priority.
+
+    SCHED_RESET_ON_FORK keeps the CPU-bound DSP worker, which is forked later,
+    on the normal scheduler so it cannot starve the rest of the system.
+    """
+    try:
+        policy = os.SCHED_FIFO | getattr(os, "SCHED_RESET_ON_FORK", 0)
+        os.sched_setscheduler(0, policy, os.sched_param(priority))
+    except (AttributeError, OSError) as e:
+        logger.warning(f"Could not set SCHED_FIFO priority {priority}: {e}")
+        return False
+    logger.info(f"Running with SCHED_FIFO priority {priority}")
+    return True
+
+
+def worker_cpus(main_cpu: Optional[int]) -> Optional[Set[int]]:
+    """
+    Cores for the DSP worker when the main process is pinned to main_cpu: every
+    other core, so demodulation never competes with the hop timer.
+    """
+    if main_cpu is None:
+        return None
+    cpus = set(range(os.cpu_count() or 1)) - {main_cpu}
+    return cpus or None
@@ -0,0 +1,109 @@
+"""
+Raw I/Q reader that hands RTL-SDR transfers straight to the DSP worker.
+"""
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# USB transfers librtlsdr keeps in flight (its own default is 15). Transfers are
+# kept small so a packet reaches the demodulator, and the hopper, one block
+# after it was received rather than several; more of them keep the same total
+# buffering (~1 s at 16 KiB each) so the dongle does not overrun while the
+# reader thread waits for the GIL. Much smaller transfers cost throughput, as
+# every one is a separate libusb completion and Python callback.
+ASYNC_BUF_NUM = 32
+
+
+async def wait_until_ready(sdr: Any, timeout: float = 1.0, interval: float = 0.01) -> bool:
+    """
+    Polls the tuner until it reports its type, for at most timeout seconds.
+    Returns False if it never did; the caller carries on either way, as a
+    fixed settle delay would have.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            # 0 is RTLSDR_TUNER_UNKNOWN: the dongle has not finished probing its tuner
+            if sdr.get_tuner_type():
+                return True
+        except Exception as e:
+            logger.debug(f"RTL-SDR not ready yet: {e}")
+        if loop.time() >= deadline:
+            logger.warning(f"RTL-SDR still not ready after {timeout}s; continuing anyway")
+            return False
+        await asyncio.sleep(interval)
+
+
+class RawSampleReader:
+    """
+    Replacement for ``async for samples in sdr.stream()``.
+
+    RtlSdrAio.stream() converts every USB transfer to a fresh complex128 array
+    (16 bytes per sample) and then bounces it through run_coroutine_threadsafe
+    and an asyncio.Queue before the runner forwards it to the worker queue.
+    Here librtlsdr's async read runs on a dedicated thread and each transfer is
+    passed to ``sink`` as raw interleaved uint8 I/Q (2 bytes per sample); the
+    demodulator's lookup table converts it into its own preallocated buffers.
+
+    ``sink`` receives librtlsdr's own transfer buffer, which is recycled as soon
+    as the callback returns: it must copy what it keeps (SampleRing.put copies
+    straight into shared memory, so a transfer is copied exactly once).
+
+    ``num_bytes`` is the size of each transfer; librtlsdr wants a multiple of
+    16 KiB. ``buf_num`` transfers are queued with the dongle at a time.
+    """
+
+    def __init__(
+        self,
+        sdr: Any,
+        num_bytes: int,
+        sink: Callable[[Any], Any],
+        buf_num: int = ASYNC_BUF_NUM,
+    ) -> None:
+        self.sdr = sdr
+        self.num_bytes = num_bytes
+        self.sink = sink
+        # pyrtlsdr passes this class attribute as rtlsdr_read_async()'s buf_num
+        sdr.DEFAULT_ASYNC_BUF_NUMBER = buf_num
+        self._thread: Optional[threading.Thread] = None
+
+    def _on_bytes(self, values: Any, context: Any) -> None:
+        # values is a ctypes view over librtlsdr's transfer buffer
+        self.sink(values)
+
+    def _read(self, loop: asyncio.AbstractEventLoop, finished: asyncio.Future) -> None:
+        try:
+            self.sdr.read_bytes_async(self._on_bytes, self.num_bytes)
+        except Exception as e:
+            logger.error(f"RTL-SDR async read failed: {e}")
+        finally:
+            try:
+                loop.call_soon_threadsafe(lambda: finished.done() or finished.set_result(None))
+            except RuntimeError:
+                # Event loop already closed during shutdown.
+                pass
+
+    async def run(self) -> None:
+        """Streams until cancelled or until librtlsdr stops delivering transfers."""
+        loop = asyncio.get_running_loop()
+        finished = loop.create_future()
+        self._thread = threading.Thread(
+            target=self._read, args=(loop, finished), name="rtlsdr-reader", daemon=True
+        )
+        self._thread.start()
+        await finished
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Cancels the async read and waits for the reader thread to exit."""
+        if self._thread is None:
+            return
+        try:
+            self.sdr.cancel_read_async()
+        except Exception as e:
+            logger.debug(f"cancel_read_async failed: {e}")
+        self._thread.join(timeout)
+        self._thread = None
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 import logging
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MQTTSensorConfig:
     name: str
     id: str  # Used as the key in the JSON payload and suffix for unique_id
@@ -16,12 +16,18 @@ class MQTTSensorConfig:
 
 
 class AbstractSensor(ABC):
+    __slots__ = ("logger",)
+
     def __init__(self, logger: logging.Logger):
         self.logger = logger
 
     @property
     @abstractmethod
     def config(self) -> MQTTSensorConfig:
+        """
+        The sensor's metadata. Decoders define it as a class-level constant
+        (the dataclass is frozen), so reading it per packet allocates nothing.
+        """
         pass
 
     @property
@@ -28,7 +28,8 @@ class SensorStore:
         self._readings: Dict[str, SensorReading] = {}
 
         # Collect metadata from all registered decoder classes via all_configs
-        for decoder_class in vars(decoders).values():
+        for name in decoders.__all__:
+            decoder_class = getattr(decoders, name)
             if (
                 isinstance(decoder_class, type)
                 and issubclass(decoder_class, AbstractSensor)
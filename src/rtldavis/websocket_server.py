@@ -28,9 +28,11 @@ class DashboardWebSocketServer:
             self.clients.remove(websocket)
             logger.debug(f"WebSocket client disconnected. Total clients: {len(self.clients)}")
 
-    async def broadcast(self, event_type: str, payload: Any):
+    def broadcast_nowait(self, event_type: str, payload: Any) -> None:
         """
-        Thread-safe entry point to push JSON messages to all connected UI clients.
+        Pushes a JSON message to all connected UI clients. Must be called from the
+        event loop thread; websockets only queues the frames, so nothing here
+        awaits and callers need no task per message.
         """
         if not self.clients:
             return
@@ -43,6 +45,12 @@ class DashboardWebSocketServer:
         # websockets.broadcast natively ignores disconnected clients and doesn't throw.
         websockets.broadcast(self.clients, message)
 
+    async def broadcast(self, event_type: str, payload: Any):
+        """
+        Thread-safe entry point to push JSON messages to all connected UI clients.
+        """
+        self.broadcast_nowait(event_type, payload)
+
     async def start(self):
         logger.warning(f"WebSocket server listening on 0.0.0.0:{self.port}")
         # Serve the websocket endpoint
@@ -1,18 +1,38 @@
+import asyncio
 import logging
 import multiprocessing
+import threading
 import time
-from typing import Optional
+from typing import Callable, List, Optional, Set, Tuple, Union
 import queue
 
-from . import protocol
+from . import protocol, scheduling
 from .protocol import Message
+from .sample_ring import SampleRing
+
+# Demodulator blocks fetched per SDR read. One block (8192 samples, 16 KiB of
+# raw I/Q, ~30 ms) per USB transfer keeps the delay between a packet arriving
+# and the hopper hearing about it to a single block; larger reads amortize
+# worker wakeups but add their whole length to every hop decision.
+BLOCKS_PER_READ = 1
+
+# Reads buffered between the SDR reader thread and the worker (~4 s of signal).
+# Further reads are dropped once this fills; samples from several hops ago are
+# useless to the hopper anyway.
+DATA_QUEUE_READS = 128
+
+# Parser handed to a forked worker. Only set around Process.start(): the child
+# inherits it copy-on-write, so the CRC and hop tables are not rebuilt there.
+_shared_parser: Optional[protocol.Parser] = None
 
 def worker_main(
-    data_queue: multiprocessing.Queue,
+    ring: SampleRing,
     result_queue: multiprocessing.Queue,
     station_id: Optional[int],
     symbol_length: int,
     log_level: int,
+    cpus: Optional[Set[int]] = None,
+    include_crc_failed: bool = False,
 ) -> None:
     """
     Main loop for the DSP worker process.
@@ -24,35 +44,149 @@ def worker_main(
     logger = logging.getLogger("rtldavis.worker")
     logger.info("DSP worker process started")
 
+    if cpus:
+        # The worker inherited the main process's pinning; move off its core. On
+        # a thread this pins only the thread itself.
+        scheduling.pin_to_cpus(cpus)
+
     # Initialize DSP and Parser
-    try:
-        p = protocol.Parser(symbol_length=symbol_length, station_id=station_id)
-    except Exception as e:
-        logger.exception(f"Failed to initialize worker: {e}")
-        return
+    p = _shared_parser
+    if p is None:
+        try:
+            p = protocol.Parser(
+                symbol_length=symbol_length,
+                station_id=station_id,
+                include_crc_failed=include_crc_failed,
+            )
+        except Exception as e:
+            logger.exception(f"Failed to initialize worker: {e}")
+            return
+
+    # Hot loop: bind the per-block callables once
+    get_samples = ring.get
+    release_samples = ring.release
+    put_result = result_queue.put
+    process_samples = p.process_samples
 
     while True:
         try:
-            # Get raw samples from the main process
-            samples = data_queue.get(timeout=1.0)
+            # Raw interleaved uint8 I/Q, viewed in place in the shared ring
+            samples = get_samples(timeout=1.0)
         except queue.Empty:
             continue
         except KeyboardInterrupt:
             break
 
         if samples is None:
-            # Sentinel value to stop the worker
+            # Ring closed by the main process
             logger.info("Worker received stop signal")
             break
 
         try:
-            packets = p.demodulator.demodulate(samples)
-            messages = p.parse(packets)
-            
+            messages = process_samples(samples)
+
             for msg in messages:
                 # Send decoded message back to main process
-                result_queue.put(msg)
+                put_result(msg)
 
         except Exception as e:
             logger.error(f"Error in DSP loop: {e}")
-            continue
+        finally:
+            # The demodulator has copied what it needs; hand the slot back
+            release_samples()
+
+
+def drain_results(result_queue: multiprocessing.Queue, max_items: int = 64) -> List[Message]:
+    """Returns everything already queued by the worker (up to max_items) without blocking."""
+    msgs: List[Message] = []
+    while len(msgs) < max_items:
+        try:
+            msgs.append(result_queue.get_nowait())
+        except queue.Empty:
+            break
+    return msgs
+
+
+def add_result_reader(
+    loop: asyncio.AbstractEventLoop,
+    result_queue: multiprocessing.Queue,
+    on_results: Callable[[List[Message]], None],
+) -> int:
+    """
+    Registers the result queue's pipe with the event loop, so decoded messages
+    are picked up by the selector the loop already runs instead of a thread
+    blocking on the queue. on_results is called from the loop with every burst.
+    Returns the file descriptor to pass to loop.remove_reader() on shutdown.
+    """
+    fd = result_queue._reader.fileno()
+
+    def _readable() -> None:
+        msgs = drain_results(result_queue)
+        if msgs:
+            on_results(msgs)
+
+    loop.add_reader(fd, _readable)
+    return fd
+
+
+def start_worker(
+    station_id: Optional[int],
+    symbol_length: int,
+    log_level: int,
+    read_bytes: int,
+    cpus: Optional[Set[int]] = None,
+    use_thread: bool = False,
+    parser: Optional[protocol.Parser] = None,
+    include_crc_failed: bool = False,
+) -> Tuple[Union[multiprocessing.Process, threading.Thread], SampleRing, multiprocessing.Queue]:
+    """
+    Spawns the DSP worker process, optionally pinned to cpus. Returns the process
+    with the sample ring (slots of read_bytes) and its result queue.
+
+    With use_thread, worker_main runs on a thread of the calling process instead.
+    That skips the fork and keeps samples in-process, but the demodulator then
+    shares the GIL with the event loop: only worth it when the numba kernel
+    (which releases the GIL) is available.
+
+    A forked worker process reuses parser, the caller's already built Parser,
+    instead of constructing its own. Threads (which would share it with the
+    hopper) and the spawn/forkserver start methods still build a fresh one, from
+    station_id, symbol_length and include_crc_failed, which must match parser's.
+    """
+    ring = SampleRing(read_bytes, DATA_QUEUE_READS)
+    result_queue = multiprocessing.Queue()
+
+    args = (ring, result_queue, station_id, symbol_length, log_level, cpus, include_crc_failed)
+    if use_thread:
+        worker = threading.Thread(
+            target=worker_main, args=args, name="rtldavis-dsp", daemon=True
+        )
+    else:
+        worker = multiprocessing.Process(target=worker_main, args=args)
+    global _shared_parser
+    if not use_thread and multiprocessing.get_start_method() == "fork":
+        _shared_parser = parser
+    try:
+        worker.start()
+    finally:
+        _shared_parser = None
+    return worker, ring, result_queue
+
+
+def stop_worker(
+    worker: Union[multiprocessing.Process, threading.Thread], ring: SampleRing, timeout: float
+) -> None:
+    """
+    Closes the ring and waits for the worker, terminating it if it does not exit
+    in time, then frees the shared memory.
+    """
+    ring.close()
+    worker.join(timeout=timeout)
+    if worker.is_alive():
+        if isinstance(worker, threading.Thread):
+            # Threads cannot be terminated, and the ring must outlive its views;
+            # the daemon thread goes away with the process.
+            return
+        worker.terminate()
+        worker.join()
+    ring.unlink()
@@ -0,0 +1,64 @@
+import asyncio
+from types import SimpleNamespace
+
+from rtldavis.hopper import Hopper
+
+
+class FakeParser:
+    def __init__(self, dwell_time):
+        self.dwell_time = dwell_time
+        self.calls = []
+
+    def next_hop(self):
+        self.calls.append("next")
+        return SimpleNamespace(kind="next")
+
+    def rand_hop(self):
+        self.calls.append("rand")
+        return SimpleNamespace(kind="rand")
+
+
+def _hopper(dwell_time=0.05):
+    p = FakeParser(dwell_time)
+    hopper = Hopper(p, lambda hop: None)
+    hopper.SETTLE_DELAY = 0.0
+    hopper.LATE_GRACE = 0.02
+    return p, hopper
+
+
+def test_trigger_before_wait_is_not_lost():
+    async def scenario():
+        _, hopper = _hopper()
+        hopper.trigger()
+        return await hopper._wait_for_packet(asyncio.get_running_loop().time() + 1.0)
+
+    assert asyncio.run(scenario()) is True
+
+
+def test_wait_times_out_at_deadline():
+    async def scenario():
+        _, hopper = _hopper()
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        received = await hopper._wait_for_packet(start + 0.05)
+        return received, loop.time() - start
+
+    received, elapsed = asyncio.run(scenario())
+    assert received is False
+    assert elapsed >= 0.04
+
+
+def test_hops_on_missed_packets_then_falls_back_to_scan():
+    async def scenario():
+        p, hopper = _hopper()
+        hopper.MAX_MISSED = 3
+        task = asyncio.create_task(hopper.run())
+        await asyncio.sleep(0)
+        hopper.trigger()
+        # sync hop + 2 missed hops + scan hop after the third miss
+        await asyncio.sleep(3 * (p.dwell_time + hopper.LATE_GRACE) + 0.1)
+        task.cancel()
+        return p.calls
+
+    calls = asyncio.run(scenario())
+    assert calls[:4] == ["next", "next", "next", "rand"]
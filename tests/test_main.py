@@ -0,0 +1,76 @@
+import pytest
+
+from rtldavis import __main__ as cli
+
+
+@pytest.fixture
+def four_dongles(monkeypatch):
+    monkeypatch.setattr(cli, "_rtlsdr_device_count", lambda: 4)
+    monkeypatch.setattr(cli, "_rtlsdr_device_serial", lambda index: f"0000000{index + 1}")
+    monkeypatch.setattr(
+        cli, "_rtlsdr_index_by_serial", lambda serial: int(serial) - 1 if len(serial) == 8 else -3
+    )
+
+
+def test_device_from_index_accepts_plain_index(four_dongles):
+    dev = cli.device_from_index("0")
+    assert dev is not None
+    assert dev.index == 0
+    assert dev.serial == "00000001"
+
+    assert cli.device_from_index("3").index == 3
+
+
+def test_device_from_index_prefers_numeric_serials(monkeypatch):
+    # Two dongles renamed with rtl_eeprom: index 0 has serial "1", index 1 has serial "2"
+    serials = ["1", "2"]
+    monkeypatch.setattr(cli, "_rtlsdr_device_count", lambda: len(serials))
+    monkeypatch.setattr(cli, "_rtlsdr_device_serial", lambda index: serials[index])
+    monkeypatch.setattr(
+        cli, "_rtlsdr_index_by_serial", lambda serial: serials.index(serial) if serial in serials else -3
+    )
+
+    # "1" is the serial of index 0, so it must go through the serial lookup
+    assert cli.device_from_index("1") is None
+    # "0" matches no serial and is still a plain index
+    assert cli.device_from_index("0").serial == "1"
+
+
+def test_device_from_index_accepts_index_matching_its_own_serial(monkeypatch):
+    monkeypatch.setattr(cli, "_rtlsdr_device_count", lambda: 2)
+    monkeypatch.setattr(cli, "_rtlsdr_device_serial", lambda index: str(index))
+    monkeypatch.setattr(cli, "_rtlsdr_index_by_serial", lambda serial: int(serial))
+
+    dev = cli.device_from_index("1")
+    assert (dev.index, dev.serial) == (1, "1")
+
+
+def test_device_from_index_leaves_serials_alone(four_dongles):
+    # Zero-padded values are RTL-SDR serials, not indices; they still need enumeration.
+    assert cli.device_from_index("00000001") is None
+    # So are numbers past the last device index
+    assert cli.device_from_index("4") is None
+    assert cli.device_from_index("1001") is None
+    assert cli.device_from_index("stick-a") is None
+    assert cli.device_from_index(None) is None
+    assert cli.device_from_index("") is None
+
+
+def test_git_info_prefers_baked_commit(monkeypatch):
+    monkeypatch.setattr(cli, "GIT_COMMIT", "abc1234")
+    monkeypatch.setattr(cli, "GIT_DIRTY", True)
+    cli.get_git_info.cache_clear()
+    try:
+        info = cli.get_git_info()
+        assert info.commit_hash == "abc1234"
+        assert info.is_dirty
+    finally:
+        cli.get_git_info.cache_clear()
+
+
+def test_version_flag_short_circuits_main(monkeypatch, capsys):
+    monkeypatch.setattr(cli.sys, "argv", ["rtldavis", "--version"])
+    monkeypatch.setattr(cli.asyncio, "run", lambda coro: pytest.fail("main_async should not run"))
+
+    assert cli.main() == 0
+    assert capsys.readouterr().out.startswith("rtldavis ")
@@ -1,3 +1,7 @@
+import json
+
+import pytest
+
 from rtldavis.mqtt import _aggregate, _circular_mean_deg
 
 
@@ -24,3 +28,165 @@ def test_wind_direction_uses_circular_mean():
 def test_circular_mean_handles_wrap_around():
     assert _circular_mean_deg([359, 1]) == 0
     assert _circular_mean_deg([90, 90, 90]) == 90
+
+
+def test_buffer_values_accumulates_and_skips_none():
+    from rtldavis.mqtt import MQTTPublisher
+
+    pub = MQTTPublisher("localhost", 1883, "homeassistant", "rtldavis", "test")
+    pub._buffer_values(1, {"temperature": 70.0, "humidity": None})
+    pub._buffer_values(1, {"temperature": 72.0, "humidity": 40.0})
+    pub._buffer(1, "seconds_since_last_data", 3)
+
+    assert pub._pending == {
+        1: {
+            "temperature": [70.0, 72.0],
+            "humidity": [40.0],
+            "seconds_since_last_data": [3],
+        }
+    }
+
+
+class _FakeClient:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, topic, payload=None, retain=False):
+        self.published.append((topic, payload, retain))
+        return (0, len(self.published))
+
+
+def test_outbox_drops_oldest_when_full(monkeypatch):
+    from rtldavis import mqtt
+
+    monkeypatch.setattr(mqtt, "OUTBOX_SIZE", 2)
+    pub = mqtt.MQTTPublisher("localhost", 1883, "homeassistant", "rtldavis", "test")
+    for i in range(3):
+        pub._enqueue(f"t/{i}", "x")
+
+    assert [topic for topic, _, _ in pub._outbox] == ["t/1", "t/2"]
+
+
+def test_outbox_never_drops_retained_publishes(monkeypatch):
+    from rtldavis import mqtt
+
+    monkeypatch.setattr(mqtt, "OUTBOX_SIZE", 2)
+    pub = mqtt.MQTTPublisher("localhost", 1883, "homeassistant", "rtldavis", "test")
+    pub._enqueue("config/0", "x", retain=True)
+    pub._enqueue("online", "x", retain=True)
+    for i in range(4):
+        pub._enqueue(f"state/{i}", "x")
+
+    assert [topic for topic, _, _ in pub._outbox] == ["config/0", "online", "state/2", "state/3"]
+
+
+def test_outbox_logs_the_evicted_topic(monkeypatch, caplog):
+    from rtldavis import mqtt
+
+    monkeypatch.setattr(mqtt, "OUTBOX_SIZE", 1)
+    pub = mqtt.MQTTPublisher("localhost", 1883, "homeassistant", "rtldavis", "test")
+    pub._enqueue("state/0", "x")
+    pub._enqueue("config/0", "x", retain=True)
+    pub._enqueue("state/1", "x")
+
+    assert [r.getMessage() for r in caplog.records] == [
+        "MQTT outbox full, dropping oldest publish to 'state/0'"
+    ]
+    assert pub._queued_states == 1
+
+
+def test_disconnect_flushes_outbox():
+    from rtldavis.mqtt import MQTTPublisher
+
+    pub = MQTTPublisher("localhost", 1883, "homeassistant", "rtldavis", "test")
+    pub.client = _FakeClient()
+    pub.client.loop_stop = pub.client.disconnect = lambda: None
+    pub._enqueue("rtldavis/1/state", "x")
+    pub._availability_topics[1] = "rtldavis/1/status"
+
+    pub.disconnect()
+
+    assert [topic for topic, _, _ in pub.client.published] == [
+        "rtldavis/1/state",
+        "rtldavis/1/status",
+    ]
+
+
+def test_publish_goes_through_background_sender():
+    import asyncio
+    from types import SimpleNamespace
+    from rtldavis.mqtt import MQTTPublisher
+
+    async def scenario():
+        pub = MQTTPublisher("localhost", 1883, "homeassistant", "rtldavis", "test")
+        pub.client = _FakeClient()
+        pub.publish(SimpleNamespace(id=2, sensor_values={"temperature": 70.0}))
+        # Nothing is sent inline; the sender task drains the outbox.
+        assert pub.client.published == []
+        while pub._outbox:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        for t in (pub._timer_task, pub._flush_task, pub._publish_task):
+            t.cancel()
+        return pub.client.published
+
+    published = asyncio.run(scenario())
+    state = [p for p in published if p[0] == "rtldavis/2/state"]
+    assert len(state) == 1
+    assert json.loads(state[0][1])["temperature"] == 70.0
+    # Discovery configs are retained and precede the first state publish
+    assert published.index(state[0]) > 0
+    assert all(retain for _, _, retain in published[: published.index(state[0])])
+
+
+def test_publish_loop_sends_queued_messages_as_one_batch():
+    import asyncio
+    from rtldavis.mqtt import MQTTPublisher
+
+    async def scenario():
+        pub = MQTTPublisher("localhost", 1883, "homeassistant", "rtldavis", "test")
+        pub.client = _FakeClient()
+        batches = []
+        send = pub._publish_batch
+        pub._publish_batch = lambda batch: (batches.append(len(batch)), send(batch))
+        for i in range(3):
+            pub._enqueue(f"t/{i}", "x")
+        task = asyncio.create_task(pub._publish_loop())
+        while len(pub.client.published) < 3:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        return batches, pub.client.published
+
+    batches, published = asyncio.run(scenario())
+    assert batches == [3]
+    assert [t for t, _, _ in published] == ["t/0", "t/1", "t/2"]
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_dumps_round_trips_payload(monkeypatch, use_orjson):
+    from rtldavis import mqtt
+
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(mqtt, "HAS_ORJSON", use_orjson)
+
+    payload = {"id": 1, "temperature": 71.5, "wind_direction": 180}
+    assert json.loads(mqtt._dumps(payload)) == payload
+
+
+def test_flush_logs_the_serialized_payload(caplog):
+    import logging
+
+    import numpy as np
+
+    from rtldavis.mqtt import MQTTPublisher
+
+    pub = MQTTPublisher("localhost", 1883, "homeassistant", "rtldavis", "test")
+    pub._state_topics[1] = "rtldavis/1/state"
+    pub._buffer_values(1, {"temperature": np.float64(70.0)})
+
+    with caplog.at_level(logging.INFO, logger="rtldavis.mqtt"):
+        pub._flush(1)
+
+    logged = caplog.records[-1].getMessage().split(": ", 1)[1]
+    assert json.loads(logged) == {"id": 1, "temperature": 70.0}
@@ -34,3 +34,118 @@ def test_crc_check():
     bad_payload = bytes([0x07, 0xC0, 0x2B, 0x0B, 0x80, 0x40, 0x8E, 0xFE])
     bad_swapped = bytes(protocol.swap_bit_order(b) for b in bad_payload)
     assert crc.checksum(bad_swapped) != 0, "Invalid packet should fail checksum"
+
+def test_crc_fast_paths_match_bytewise():
+    import random
+    from rtldavis.crc import CRC
+
+    crc = CRC("CCITT-16", 0, 0x1021, 0)
+
+    def bytewise(data):
+        value = 0
+        for byte in data:
+            value = ((value << 8) & 0xFFFF) ^ int(crc.tbl[(value >> 8) ^ byte])
+        return value
+
+    rng = random.Random(0)
+    for length in range(0, 25):
+        data = bytes(rng.randrange(256) for _ in range(length))
+        assert crc.checksum(data) == bytewise(data), length
+        crc._hqx = False
+        assert crc.checksum(data) == bytewise(data), length
+        crc._hqx = True
+
+def test_crc_tables_are_shared_per_polynomial():
+    from rtldavis.crc import CRC
+
+    a = CRC("CCITT-16", 0, 0x1021, 0)
+    b = CRC("CCITT-16/AUG", 0x1D0F, 0x1021, 0)
+    assert a.tbl is b.tbl
+    assert not a.tbl.flags.writeable
+
+def test_process_samples_demodulates_each_block():
+    """
+    A multi-block read must be fed to the demodulator one block at a time,
+    in order, with any trailing partial block carried over to the next read.
+    """
+    import numpy as np
+
+    p = protocol.Parser(symbol_length=14)
+    seen = []
+    p.demodulator.demodulate = lambda block: seen.append(block.copy()) or []
+
+    bs = p.cfg.block_size
+    samples = np.arange(3 * bs + 5).astype(np.complex128)
+    assert p.process_samples(samples) == []
+
+    assert len(seen) == 3
+    for i, block in enumerate(seen):
+        assert block.size == bs
+        assert block[0] == i * bs
+
+    # The 5 leftover samples lead the next block
+    seen.clear()
+    p.process_samples(np.arange(3 * bs + 5, 4 * bs).astype(np.complex128))
+    assert len(seen) == 1
+    assert np.array_equal(seen[0].real, np.arange(3 * bs, 4 * bs))
+
+    # Raw uint8 I/Q is interleaved, so a block is twice as many elements.
+    seen.clear()
+    p.process_samples(np.zeros(2 * p.cfg.block_size2, dtype=np.uint8))
+    assert len(seen) == 2
+    assert seen[0].size == p.cfg.block_size2
+
+
+def test_process_samples_keeps_leftover_across_sample_formats():
+    import numpy as np
+
+    p = protocol.Parser(symbol_length=14)
+    seen = []
+    p.demodulator.demodulate = lambda block: seen.append(block.copy()) or []
+    bs = p.cfg.block_size
+    lut = p.demodulator.byte_to_cmplx.lut
+
+    # 5 complex samples left over, then a raw read: one complex block, nothing lost
+    p.process_samples(np.arange(bs + 5).astype(np.complex64))
+    raw = np.full(2 * (bs - 5), 200, dtype=np.uint8)
+    seen.clear()
+    p.process_samples(raw)
+    assert len(seen) == 1
+    assert np.array_equal(seen[0][:5], np.arange(bs, bs + 5))
+    assert np.all(seen[0][5:] == np.complex64(complex(lut[200], lut[200])))
+
+    # 3 raw I/Q pairs left over, then a complex read
+    p.process_samples(np.full(p.cfg.block_size2 + 6, 100, dtype=np.uint8))
+    seen.clear()
+    p.process_samples(np.ones(bs - 3, dtype=np.complex64))
+    assert len(seen) == 1
+    mixed = seen[0]
+    assert mixed.size == bs
+    assert np.all(mixed[:3] == np.complex64(complex(lut[100], lut[100])))
+    assert np.all(mixed[3:] == 1)
+
+
+def test_message_repr_and_eq_ignore_packet():
+    import numpy as np
+    from rtldavis import dsp
+
+    def msg(data):
+        pkt = dsp.Packet(index=0, data=np.frombuffer(data, dtype=np.uint8), rssi=-50.0, snr=10.0)
+        return protocol.Message(
+            packet=pkt, id=1, sensor_type=protocol.SensorType.TEMPERATURE,
+            sensor_values={"temperature": 70.0},
+        )
+
+    a = msg(bytes(10))
+    b = msg(bytes(range(10)))
+    assert "packet" not in repr(a)
+    assert "array" not in repr(a)
+    assert a == b
+
+def test_stateful_decoders_are_kept_per_station():
+    p = protocol.Parser(symbol_length=14)
+    rain = protocol.SensorType.RAIN
+
+    a = p._get_decoder(1, rain)
+    assert p._get_decoder(1, rain) is a
+    assert p._get_decoder(2, rain) is not a
@@ -0,0 +1,76 @@
+import multiprocessing
+import queue
+from ctypes import c_ubyte
+
+import numpy as np
+import pytest
+
+from rtldavis.sample_ring import SampleRing
+
+
+@pytest.fixture
+def ring():
+    r = SampleRing(slot_bytes=4, slots=2)
+    yield r
+    r.unlink()
+
+
+def test_slot_count_must_be_a_power_of_two():
+    with pytest.raises(ValueError):
+        SampleRing(slot_bytes=4, slots=3)
+
+
+def test_reads_come_back_in_order_and_slots_are_reused(ring):
+    for i in range(5):
+        assert ring.put(bytes([i, i, i, i]))
+        view = ring.get(timeout=1)
+        assert view.tolist() == [i, i, i, i]
+        ring.release()
+
+
+def test_accepts_ctypes_transfer_buffers(ring):
+    ring.put((c_ubyte * 4)(1, 2, 3, 4))
+    assert ring.get(timeout=1).tolist() == [1, 2, 3, 4]
+
+
+def test_full_ring_drops_new_reads(ring):
+    assert ring.put(b"\x01" * 4)
+    assert ring.put(b"\x02" * 4)
+    assert not ring.put(b"\x03" * 4)
+
+    assert ring.get(timeout=1)[0] == 1
+    ring.release()
+    assert ring.get(timeout=1)[0] == 2
+
+
+def test_get_times_out_when_empty(ring):
+    with pytest.raises(queue.Empty):
+        ring.get(timeout=0.01)
+
+
+def test_close_drains_then_stops(ring):
+    ring.put(b"\x07" * 4)
+    ring.close()
+
+    assert ring.get(timeout=1)[0] == 7
+    ring.release()
+    assert ring.get(timeout=1) is None
+
+
+def _consume(ring, out):
+    while (view := ring.get(timeout=5)) is not None:
+        out.put(int(view.sum()))
+        ring.release()
+
+
+def test_worker_process_reads_shared_slots(ring):
+    out = multiprocessing.get_context("fork").Queue()
+    proc = multiprocessing.get_context("fork").Process(target=_consume, args=(ring, out))
+    proc.start()
+    for i in range(1, 4):
+        while not ring.put(np.full(4, i, dtype=np.uint8)):
+            pass
+    ring.close()
+    proc.join(timeout=5)
+
+    assert [out.get(timeout=1) for _ in range(3)] == [4, 8, 12]
@@ -0,0 +1,23 @@
+from rtldavis import scheduling
+
+
+def test_worker_cpus_excludes_main_core(monkeypatch):
+    monkeypatch.setattr(scheduling.os, "cpu_count", lambda: 4)
+    assert scheduling.worker_cpus(2) == {0, 1, 3}
+    assert scheduling.worker_cpus(None) is None
+
+
+def test_worker_cpus_on_single_core_leaves_worker_unpinned(monkeypatch):
+    monkeypatch.setattr(scheduling.os, "cpu_count", lambda: 1)
+    assert scheduling.worker_cpus(0) is None
+
+
+def test_failures_are_reported_not_raised(monkeypatch):
+    def denied(*args):
+        raise PermissionError("operation not permitted")
+
+    monkeypatch.setattr(scheduling.os, "sched_setaffinity", denied, raising=False)
+    monkeypatch.setattr(scheduling.os, "sched_setscheduler", denied, raising=False)
+
+    assert scheduling.pin_to_cpus({0}) is False
+    assert scheduling.set_realtime_priority(10) is False
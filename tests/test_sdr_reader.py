@@ -0,0 +1,71 @@
+import asyncio
+from ctypes import c_ubyte
+
+from rtldavis.sdr_reader import RawSampleReader, wait_until_ready
+
+
+class FakeSdr:
+    """Mimics pyrtlsdr's read_bytes_async callback contract."""
+
+    def __init__(self, transfers):
+        self.transfers = transfers
+        self.cancelled = False
+
+    def read_bytes_async(self, callback, num_bytes):
+        for chunk in self.transfers:
+            buf = (c_ubyte * num_bytes)(*chunk)
+            callback(buf, self)
+            # librtlsdr reuses the transfer buffer once the callback returns
+            for i in range(num_bytes):
+                buf[i] = 0
+
+    def cancel_read_async(self):
+        self.cancelled = True
+
+
+def test_reader_delivers_each_transfer_to_sink():
+    sdr = FakeSdr([[1, 2, 3, 4], [5, 6, 7, 8]])
+    received = []
+    # The sink must copy: the transfer buffer is recycled after the callback
+    reader = RawSampleReader(sdr, 4, lambda buf: received.append(bytes(buf)))
+
+    asyncio.run(reader.run())
+
+    assert received == [bytes([1, 2, 3, 4]), bytes([5, 6, 7, 8])]
+
+
+def test_stop_cancels_async_read():
+    sdr = FakeSdr([[0, 0]])
+    reader = RawSampleReader(sdr, 2, lambda b: None)
+    asyncio.run(reader.run())
+    reader.stop()
+    assert sdr.cancelled
+
+
+def test_reader_sets_async_buffer_count():
+    sdr = FakeSdr([])
+    RawSampleReader(sdr, 2, lambda b: None, buf_num=48)
+    assert sdr.DEFAULT_ASYNC_BUF_NUMBER == 48
+
+
+class SlowTunerSdr:
+    def __init__(self, not_ready_polls):
+        self.polls = 0
+        self.not_ready_polls = not_ready_polls
+
+    def get_tuner_type(self):
+        self.polls += 1
+        if self.polls <= self.not_ready_polls:
+            raise OSError("device busy")
+        return 5  # RTLSDR_TUNER_R820T
+
+
+def test_wait_until_ready_returns_once_tuner_answers():
+    sdr = SlowTunerSdr(not_ready_polls=2)
+    assert asyncio.run(wait_until_ready(sdr, timeout=1.0, interval=0.001))
+    assert sdr.polls == 3
+
+
+def test_wait_until_ready_gives_up_after_timeout():
+    sdr = SlowTunerSdr(not_ready_polls=10**6)
+    assert not asyncio.run(wait_until_ready(sdr, timeout=0.05, interval=0.01))
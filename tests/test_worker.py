@@ -0,0 +1,149 @@
+import asyncio
+import multiprocessing
+import time
+
+from rtldavis.worker import add_result_reader, drain_results
+
+
+def test_drain_results_returns_whole_burst():
+    q = multiprocessing.Queue()
+    for i in range(5):
+        q.put(i)
+    time.sleep(0.1)  # let the queue's feeder thread flush into the pipe
+
+    assert drain_results(q) == [0, 1, 2, 3, 4]
+    assert drain_results(q) == []
+
+
+def test_drain_results_caps_batch_size():
+    q = multiprocessing.Queue()
+    for i in range(5):
+        q.put(i)
+    time.sleep(0.1)  # let the queue's feeder thread flush into the pipe
+
+    assert drain_results(q, max_items=3) == [0, 1, 2]
+    assert drain_results(q) == [3, 4]
+
+
+def test_add_result_reader_delivers_from_event_loop():
+    q = multiprocessing.Queue()
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        received = []
+        done = loop.create_future()
+
+        def on_results(msgs):
+            received.extend(msgs)
+            if len(received) == 3 and not done.done():
+                done.set_result(None)
+
+        fd = add_result_reader(loop, q, on_results)
+        try:
+            for i in range(3):
+                q.put(i)
+            await asyncio.wait_for(done, timeout=5)
+        finally:
+            loop.remove_reader(fd)
+        return received
+
+    assert asyncio.run(main()) == [0, 1, 2]
+
+
+def test_thread_worker_decodes_from_ring():
+    import logging
+
+    from test_dsp import _synth_packet_iq
+    from rtldavis import protocol
+    from rtldavis.worker import BLOCKS_PER_READ, start_worker, stop_worker
+
+    cfg = protocol.new_packet_config(14)
+    raw = _synth_packet_iq(cfg, bytes([0x07, 0xC0, 0x2B, 0x0B, 0x80, 0x40, 0x8E, 0xFF]))
+    read_bytes = cfg.block_size * BLOCKS_PER_READ * 2
+
+    worker, ring, results = start_worker(None, 14, logging.WARNING, read_bytes, use_thread=True)
+    try:
+        for i in range(0, raw.size, read_bytes):
+            assert ring.put(raw[i : i + read_bytes])
+        msg = results.get(timeout=10)
+    finally:
+        stop_worker(worker, ring, timeout=5)
+
+    assert msg.sensor_type == protocol.SensorType.RAIN
+    assert not worker.is_alive()
+
+
+def test_forked_worker_reuses_parent_parser():
+    import logging
+    import queue
+
+    import pytest
+
+    from test_dsp import _synth_packet_iq
+    from rtldavis import protocol, worker as worker_mod
+    from rtldavis.worker import BLOCKS_PER_READ, start_worker, stop_worker
+
+    if multiprocessing.get_start_method() != "fork":
+        pytest.skip("parser sharing needs the fork start method")
+
+    cfg = protocol.new_packet_config(14)
+    raw = _synth_packet_iq(cfg, bytes([0x07, 0xC0, 0x2B, 0x0B, 0x80, 0x40, 0x8E, 0xFF]))
+    read_bytes = cfg.block_size * BLOCKS_PER_READ * 2
+    # Filters out the packet's station; a worker building its own Parser would not
+    parser = protocol.Parser(symbol_length=14, station_id=5)
+
+    worker, ring, results = start_worker(None, 14, logging.WARNING, read_bytes, parser=parser)
+    assert worker_mod._shared_parser is None
+    try:
+        for i in range(0, raw.size, read_bytes):
+            assert ring.put(raw[i : i + read_bytes])
+        with pytest.raises(queue.Empty):
+            results.get(timeout=2)
+    finally:
+        stop_worker(worker, ring, timeout=5)
+
+
+def test_thread_worker_pins_itself_to_worker_cpus(monkeypatch):
+    import logging
+    import threading
+
+    from rtldavis import scheduling
+    from rtldavis.worker import start_worker, stop_worker
+
+    pinned = []
+    monkeypatch.setattr(
+        scheduling, "pin_to_cpus", lambda cpus: pinned.append((threading.current_thread().name, cpus))
+    )
+
+    worker, ring, _ = start_worker(None, 14, logging.WARNING, 1024, cpus={1, 2}, use_thread=True)
+    stop_worker(worker, ring, timeout=5)
+
+    assert pinned == [("rtldavis-dsp", {1, 2})]
+
+
+def test_thread_worker_honours_include_crc_failed(caplog):
+    import logging
+
+    from test_dsp import _synth_packet_iq
+    from rtldavis import protocol
+    from rtldavis.worker import BLOCKS_PER_READ, start_worker, stop_worker
+
+    cfg = protocol.new_packet_config(14)
+    # Last CRC byte flipped: the packet demodulates but fails the check
+    raw = _synth_packet_iq(cfg, bytes([0x07, 0xC0, 0x2B, 0x0B, 0x80, 0x40, 0x8E, 0x00]))
+    read_bytes = cfg.block_size * BLOCKS_PER_READ * 2
+
+    caplog.set_level(logging.WARNING, logger="rtldavis.protocol")
+    worker, ring, _ = start_worker(
+        None, 14, logging.WARNING, read_bytes, use_thread=True, include_crc_failed=True
+    )
+    try:
+        for i in range(0, raw.size, read_bytes):
+            assert ring.put(raw[i : i + read_bytes])
+        deadline = time.monotonic() + 10
+        while "CRC FAILED" not in caplog.text and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        stop_worker(worker, ring, timeout=5)
+
+    assert "CRC FAILED" in caplog.text